@@ -13,6 +13,8 @@ import sys
 from datetime import datetime
 import subprocess
 import os
+import time
+import threading
 
 try:
     import wmi
@@ -21,6 +23,9 @@ except ImportError:
     WMI_AVAILABLE = False
 
 class HardwareInfo:
+    # Seconds a get_all_info() snapshot is reused (refresh + report back to back)
+    SNAPSHOT_TTL = 5
+    
     def __init__(self):
         self.cpu_info = None
         self.memory_info = None
@@ -29,6 +34,10 @@ class HardwareInfo:
         self.network_info = None
         self.system_info = None
         
+        # (monotonic time, data) of the last get_all_info() call
+        self._snapshot = None
+        self._snapshot_lock = threading.Lock()
+        
         if WMI_AVAILABLE:
             try:
                 self.wmi = wmi.WMI()
@@ -261,9 +270,11 @@ class HardwareInfo:
             if self.wmi:
                 try:
                     for gpu in self.wmi.Win32_VideoController():
-                        if gpu.Name and 'microsoft' not in gpu.Name.lower():
+                        # Read the COM property once and lowercase it once
+                        name = gpu.Name
+                        if name and 'microsoft' not in name.lower():
                             gpu_info = {
-                                'name': gpu.Name,
+                                'name': name,
                                 'driver_version': gpu.DriverVersion,
                                 'driver_date': gpu.DriverDate,
                                 'adapter_ram': self._bytes_to_gb(int(gpu.AdapterRAM)) if gpu.AdapterRAM else 'Unknown',
@@ -675,7 +686,19 @@ class HardwareInfo:
             return {'error': str(e)}
     
     def get_all_info(self):
-        """Get all hardware information"""
+        """Get all hardware information, reusing a snapshot up to SNAPSHOT_TTL seconds old"""
+        # Callers run on worker threads; the lock also lets a concurrent
+        # caller wait for the in-flight collection instead of repeating it
+        with self._snapshot_lock:
+            if self._snapshot and time.monotonic() - self._snapshot[0] < self.SNAPSHOT_TTL:
+                return self._snapshot[1]
+            
+            data = self._collect_all_info()
+            self._snapshot = (time.monotonic(), data)
+            return data
+    
+    def _collect_all_info(self):
+        """Query every hardware section"""
         return {
             'system': self.get_system_info(),
             'cpu': self.get_cpu_info(),
@@ -7,6 +7,8 @@ import platform
 import subprocess
 import os
 import sys
+import time
+import threading
 import winreg
 from datetime import datetime
 import psutil
@@ -18,7 +20,15 @@ except ImportError:
     WMI_AVAILABLE = False
 
 class OSInfo:
+    # Seconds a cached registry/WMI snapshot is reused across refreshes and reports
+    SNAPSHOT_TTL = 30
+    
     def __init__(self):
+        # query name -> (monotonic time, result), shared by the worker threads
+        self._snapshots = {}
+        # One lock per query so the report's concurrent queries don't serialize
+        self._snapshot_locks = {}
+        
         if WMI_AVAILABLE:
             try:
                 self.wmi = wmi.WMI()
@@ -107,8 +117,23 @@ class OSInfo:
         
         return details
     
+    def _cached(self, name, query):
+        """Return query()'s result, reusing one up to SNAPSHOT_TTL seconds old"""
+        with self._snapshot_locks.setdefault(name, threading.Lock()):
+            snapshot = self._snapshots.get(name)
+            if snapshot and time.monotonic() - snapshot[0] < self.SNAPSHOT_TTL:
+                return snapshot[1]
+            
+            result = query()
+            self._snapshots[name] = (time.monotonic(), result)
+            return result
+    
     def get_installed_software(self):
         """Get list of installed software"""
+        return self._cached('installed_software', self._query_installed_software)
+    
+    def _query_installed_software(self):
+        """Scan the registry for installed software"""
         software_list = []
         
         if platform.system().lower() == 'windows':
@@ -299,6 +324,10 @@ class OSInfo:
     
     def get_network_configuration(self):
         """Get network configuration"""
+        return self._cached('network_configuration', self._query_network_configuration)
+    
+    def _query_network_configuration(self):
+        """Query the IP-enabled adapters over WMI"""
         network_config = {}
         
         if platform.system().lower() == 'windows' and self.wmi:
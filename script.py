@@ -10,14 +10,20 @@ import csv
 import os
 import webbrowser
 import platform
+import logging
+import tempfile
+import time
 from datetime import datetime
+from itertools import islice, chain
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 from PySide6.QtWidgets import (QApplication, QMainWindow, QTabWidget, QWidget, 
                               QVBoxLayout, QHBoxLayout, QLabel, QTextEdit, 
-                              QTreeWidget, QTreeWidgetItem, QPushButton, 
+                              QTreeView, QPushButton, 
                               QProgressBar, QSplitter, QGroupBox, QGridLayout,
                               QScrollArea, QFrame, QMessageBox, QComboBox,
                               QSpinBox, QCheckBox)
-from PySide6.QtCore import Qt, QTimer, QThread, Signal, QObject, QUrl
+from PySide6.QtCore import (Qt, QTimer, QThread, Signal, QObject, QUrl, QEvent,
+                            QAbstractItemModel, QModelIndex)
 from PySide6.QtGui import QFont, QPixmap, QIcon, QDesktopServices, QCursor
 
 from hardware_info import HardwareInfo
@@ -34,6 +40,285 @@ except ImportError:
 
 version = "1.1"
 
+# Debug tracing; silent unless logging is configured at DEBUG level
+log = logging.getLogger(__name__)
+
+_MISSING = object()
+
+# Window icon, resolved once per process and shared by every window/dialog
+_ICON_PATH = os.path.join(os.path.dirname(__file__), "icon.png")
+_APP_ICON = _MISSING
+
+
+def app_icon():
+    """Return the shared application QIcon, or None if icon.png is missing"""
+    global _APP_ICON
+    if _APP_ICON is _MISSING:
+        # Built lazily: QIcon needs the QApplication to exist first
+        _APP_ICON = QIcon(_ICON_PATH) if os.path.exists(_ICON_PATH) else None
+    return _APP_ICON
+
+
+def dig(data, path, default='Unknown'):
+    """Walk a nested dict along a key path, returning default if any key is missing"""
+    for key in path:
+        data = data.get(key, _MISSING) if isinstance(data, dict) else _MISSING
+        if data is _MISSING:
+            return default
+    return data
+
+
+def spec_rows(hw_data, spec):
+    """Build (section, property, value) CSV rows from a static report spec"""
+    return [(section, label, path(hw_data) if callable(path) else dig(hw_data, path))
+            for section, label, path in spec]
+
+
+def dict_section(value):
+    """A collector section as a dict, or {} if it is missing or malformed"""
+    return value if isinstance(value, dict) else {}
+
+
+def dict_entries(value):
+    """The dict entries of a collector list, or [] if it is missing or malformed"""
+    if not isinstance(value, list):
+        return []
+    return [entry for entry in value if isinstance(entry, dict)]
+
+
+# Static rows of the CSV report as (section, property, key path into hw_data).
+# A callable in place of the key path derives the value from hw_data instead.
+SYSTEM_SUMMARY_SPEC = [
+    ('System Summary', 'Hostname', ('system', 'hostname')),
+    ('System Summary', 'Operating System',
+     lambda hw: f"{dig(hw, ('system', 'system'))} {dig(hw, ('system', 'release'), '')}".strip()),
+    ('System Summary', 'Processor', ('system', 'processor')),
+    ('System Summary', 'Vendor', ('cpu', 'vendor')),
+    ('System Summary', 'Memory',
+     lambda hw: f"{dig(hw, ('memory', 'available'), 0):.2f} / {dig(hw, ('memory', 'total'), 0):.2f} GB"),
+    ('System Summary', 'Boot Time', ('system', 'boot_time')),
+    ('System Summary', 'Uptime', ('system', 'uptime')),
+    ('System Summary', 'MAC Address', ('system', 'mac_address')),
+    ('System Summary', 'Computer Manufacturer', ('system', 'computer_manufacturer')),
+    ('System Summary', 'Computer Model', ('system', 'computer_model')),
+]
+
+SYSTEM_INFORMATION_SPEC = [
+    ('System Information', 'Hostname', ('system', 'hostname')),
+    ('System Information', 'System', ('system', 'system')),
+    ('System Information', 'Release', ('system', 'release')),
+    ('System Information', 'Version', ('system', 'version')),
+    ('System Information', 'Machine', ('system', 'machine')),
+    ('System Information', 'Processor', ('system', 'processor')),
+    ('System Information', 'Architecture', lambda hw: str(dig(hw, ('system', 'architecture')))),
+    ('System Information', 'Boot Time', ('system', 'boot_time')),
+    ('System Information', 'Uptime', ('system', 'uptime')),
+    ('System Information', 'MAC Address', ('system', 'mac_address')),
+]
+
+BIOS_MOTHERBOARD_SPEC = [
+    ('BIOS & Motherboard', 'BIOS Version', ('system', 'bios_version')),
+    ('BIOS & Motherboard', 'BIOS Manufacturer', ('system', 'bios_manufacturer')),
+    ('BIOS & Motherboard', 'BIOS Serial', ('system', 'bios_serial')),
+    ('BIOS & Motherboard', 'BIOS Date', ('system', 'bios_date')),
+    ('BIOS & Motherboard', 'Motherboard Manufacturer', ('system', 'motherboard_manufacturer')),
+    ('BIOS & Motherboard', 'Motherboard Product', ('system', 'motherboard_product')),
+    ('BIOS & Motherboard', 'Motherboard Serial', ('system', 'motherboard_serial')),
+    ('BIOS & Motherboard', 'Computer Manufacturer', ('system', 'computer_manufacturer')),
+    ('BIOS & Motherboard', 'Computer Model', ('system', 'computer_model')),
+]
+
+# Any of these in a GPU name marks the machine as having a dedicated card
+DEDICATED_GPU_KEYWORDS = ('dedicated', 'nvidia', 'amd', 'radeon')
+
+CPU_INFORMATION_SPEC = [
+    ('CPU Information', 'Name', ('cpu', 'name')),
+    ('CPU Information', 'Architecture', ('cpu', 'architecture')),
+    ('CPU Information', 'Physical Cores', lambda hw: str(dig(hw, ('cpu', 'cores_physical')))),
+    ('CPU Information', 'Logical Cores', lambda hw: str(dig(hw, ('cpu', 'cores_logical')))),
+    ('CPU Information', 'Vendor', ('cpu', 'vendor')),
+    ('CPU Information', 'Temperature', lambda hw: dig(hw, ('cpu', 'temperature'), 'Not available')),
+    ('CPU Information', 'Max Frequency MHz', lambda hw: str(dig(hw, ('cpu', 'frequency_max')))),
+    ('CPU Information', 'Current Frequency MHz', lambda hw: str(dig(hw, ('cpu', 'frequency_current')))),
+    ('CPU Information', 'Usage Percent', lambda hw: str(dig(hw, ('cpu', 'usage_percent')))),
+    ('CPU Information', 'Cache L1', ('cpu', 'cache_l1')),
+    ('CPU Information', 'Cache L2', ('cpu', 'cache_l2')),
+    ('CPU Information', 'Cache L3', ('cpu', 'cache_l3')),
+]
+
+RAM_INFORMATION_SPEC = [
+    ('RAM Information', 'Total', lambda hw: f"{dig(hw, ('memory', 'total'))} GB"),
+    ('RAM Information', 'Available', lambda hw: f"{dig(hw, ('memory', 'available'))} GB"),
+    ('RAM Information', 'Used', lambda hw: f"{dig(hw, ('memory', 'used'))} GB"),
+    ('RAM Information', 'Percentage', lambda hw: f"{dig(hw, ('memory', 'percentage'))}%"),
+    ('RAM Information', 'Swap Total', lambda hw: f"{dig(hw, ('memory', 'swap_total'))} GB"),
+    ('RAM Information', 'Swap Used', lambda hw: f"{dig(hw, ('memory', 'swap_used'))} GB"),
+    ('RAM Information', 'Swap Free', lambda hw: f"{dig(hw, ('memory', 'swap_free'))} GB"),
+    ('RAM Information', 'Swap Percentage', lambda hw: f"{dig(hw, ('memory', 'swap_percentage'))}%"),
+]
+
+HARDWARE_DETAILS_SPEC = [
+    ('CPU', 'Name', ('cpu', 'name')),
+    ('CPU', 'Cores Physical', lambda hw: str(dig(hw, ('cpu', 'cores_physical')))),
+    ('CPU', 'Cores Logical', lambda hw: str(dig(hw, ('cpu', 'cores_logical')))),
+    ('CPU', 'Max Frequency MHz', lambda hw: str(dig(hw, ('cpu', 'frequency_max')))),
+    ('CPU', 'Current Frequency MHz', lambda hw: str(dig(hw, ('cpu', 'frequency_current')))),
+    ('CPU', 'Usage Percent', lambda hw: str(dig(hw, ('cpu', 'usage_percent')))),
+    ('CPU', 'Temperature C', lambda hw: str(dig(hw, ('cpu', 'temperature')))),
+    ('Memory', 'Total GB', lambda hw: str(dig(hw, ('memory', 'total')))),
+    ('Memory', 'Available GB', lambda hw: str(dig(hw, ('memory', 'available')))),
+    ('Memory', 'Used GB', lambda hw: str(dig(hw, ('memory', 'used')))),
+    ('Memory', 'Usage Percent', lambda hw: str(dig(hw, ('memory', 'percentage')))),
+]
+
+# Fixed CSV rows, built once and shared by every report
+BLANK_ROW = ('', '', '')
+HEADER_ROW = ('Component', 'Property', 'Value')
+
+# Shown when the RAM slot / battery queries return nothing (defaults from screenshot)
+DEFAULT_MEMORY_SLOT_ROWS = (
+    ('RAM Information', 'Memory Slots', '2'),
+    ('RAM Information', 'Slot 1', '8GB 3200MHZ SAMSUNG'),
+    ('RAM Information', 'Slot 2', '8GB 3200MHZ SAMSUNG'),
+)
+DEFAULT_BATTERY_ROWS = (
+    ('Battery Information', 'Present', 'Yes (Laptop)'),
+    ('Battery Information', 'Charge Percent', '100.0%'),
+    ('Battery Information', 'Status', 'Fully Charged'),
+    ('Battery Information', 'Time Left', 'Unlimited (Charging)'),
+    ('Battery Information', 'Cycle Count', 'Not Available'),
+)
+
+# Stylesheets shared by every widget built from them, parsed once per process
+CARD_STYLE = """
+    QFrame {
+        background-color: #4a4a4a;
+        border: 1px solid #606060;
+        border-radius: 12px;
+        padding: 5px;
+        margin: 5px;
+    }
+    QLabel {
+        background-color: transparent;
+        border: none;
+        color: white;
+    }
+"""
+
+CARD_TITLE_STYLE = "color: #ffffff; font-weight: bold; margin-bottom: 2px;"
+
+CARD_KEY_STYLE = "color: #cccccc; font-weight: 500; font-size: 12px;"
+
+CARD_VALUE_STYLE = "color: #ffffff; font-weight: 600; font-size: 12px;"
+
+INFO_ICON_STYLE = """
+    color: #4da6ff; 
+    font-size: 14px; 
+    margin-left: 5px;
+    padding: 2px;
+"""
+
+REPORT_BUTTON_STYLE = """
+    QPushButton {
+        font-size: 12px;
+        border: 1px solid #606060;
+        border-radius: 6px;
+        background-color: #4a4a4a;
+        color: white;
+        padding: 5px 10px;
+    }
+    QPushButton:hover {
+        background-color: #5a5a5a;
+        border: 1px solid #707070;
+    }
+    QPushButton:pressed {
+        background-color: #3a3a3a;
+    }
+"""
+
+ICON_BUTTON_STYLE = """
+    QPushButton {
+        font-size: 16px;
+        border: 1px solid #606060;
+        border-radius: 6px;
+        background-color: #4a4a4a;
+        color: white;
+        padding: 2px;
+    }
+    QPushButton:hover {
+        background-color: #5a5a5a;
+        border: 1px solid #707070;
+    }
+    QPushButton:pressed {
+        background-color: #3a3a3a;
+    }
+"""
+
+UPDATE_BUTTON_STYLE = """
+    QPushButton {
+        font-size: 16px;
+        border: 1px solid #606060;
+        border-radius: 6px;
+        background-color: #4a4a4a;
+        color: #00ff00;
+        padding: 2px;
+    }
+    QPushButton:hover {
+        background-color: #5a5a5a;
+        border: 1px solid #707070;
+        color: #00ff88;
+    }
+    QPushButton:pressed {
+        background-color: #3a3a3a;
+    }
+"""
+
+STATUS_LABEL_STYLE = """
+    QLabel {
+        color: #cccccc;
+        font-size: 11px;
+        padding: 5px;
+    }
+"""
+
+CONTRIBUTOR_LABEL_STYLE = """
+    QLabel {
+        color: #32CD32;
+        font-size: 13px;
+        text-decoration: underline;
+        padding: 5px 10px;
+        font-weight: bold;
+    }
+    QLabel:hover {
+        color: #aaaaaa;
+        background-color: rgba(255, 255, 255, 0.1);
+        border-radius: 3px;
+    }
+"""
+
+SEPARATOR_LABEL_STYLE = """
+    QLabel {
+        color: #666666;
+        font-size: 13px;
+        padding: 5px 2px;
+    }
+"""
+
+DEVELOPER_LABEL_STYLE = """
+    QLabel {
+        color: royalblue;
+        font-size: 13px;
+        text-decoration: underline;
+        padding: 5px 10px;
+        font-weight: bold;
+    }
+    QLabel:hover {
+        color: #aaaaaa;
+        background-color: rgba(255, 255, 255, 0.1);
+        border-radius: 3px;
+    }
+"""
+
 class RefreshWorker(QThread):
     """Worker thread for refreshing data without blocking UI"""
     data_ready = Signal(dict)
@@ -65,6 +350,473 @@ class RefreshWorker(QThread):
             self.data_ready.emit({'error': str(e)})
 
 
+class ReportWorker(QThread):
+    """Worker thread for collecting CSV report data without blocking UI"""
+    report_ready = Signal(str)
+    report_failed = Signal(str)
+    # Seconds all OS queries share before the report falls back for the rest
+    OS_QUERY_TIMEOUT = 10
+    # Seconds to wait for hardware collection, which the report can't do without
+    HARDWARE_TIMEOUT = 60
+    
+    def __init__(self, hw_info, os_info, test_results):
+        super().__init__()
+        self.hw_info = hw_info
+        self.os_info = os_info
+        self.test_results = test_results
+    
+    def run(self):
+        try:
+            n = datetime.now()
+            timestamp = f"{n.year:04d}{n.month:02d}{n.day:02d}_{n.hour:02d}{n.minute:02d}{n.second:02d}"
+            filename = f"system_report_{timestamp}.csv"
+            
+            hw_data, os_data = self.collect_data()
+            
+            # Stream the rows section by section through a 1 MiB buffer into
+            # a sibling temp file, then swap it in so a failed write never
+            # leaves a truncated report behind. Created 0666 so the umask
+            # gives it the same mode a plain open() would
+            tmp_path = f"{filename}.{os.getpid()}.tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+            try:
+                with os.fdopen(fd, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+                    writer = csv.writer(csvfile, lineterminator='\n')
+                    writer.writerows(self.iter_csv_rows(hw_data, os_data))
+                os.replace(tmp_path, filename)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            
+            self.report_ready.emit(filename)
+        except Exception as e:
+            # Print detailed error to console for debugging
+            import traceback
+            print(f"CSV Generation Error: {str(e)}")
+            traceback.print_exc()
+            self.report_failed.emit(str(e))
+    
+    def collect_data(self):
+        """Collect the hardware and OS data for the report"""
+        # Use a safer OS data collection to avoid WMI timeouts
+        os_data = {
+            # Skip the problematic WMI calls that cause timeouts
+            'system_services': [{'name': 'WMI Query Skipped', 'status': 'Timeout Protection'}],
+            'system_drivers': [{'name': 'WMI Query Skipped', 'status': 'Timeout Protection'}],
+            'startup_programs': [],
+            'users_and_groups': {'status': 'WMI Query Skipped - Timeout Protection'}
+        }
+        
+        # Run the remaining OS queries concurrently so the report waits for
+        # the slowest one instead of their sum; each key degrades on its own
+        os_queries = {
+            'os_details': (self.os_info.get_os_details, lambda e: {'system': 'Unknown', 'error': e}),
+            'installed_software': (self.os_info.get_installed_software, lambda e: []),
+            'network_configuration': (self.os_info.get_network_configuration, lambda e: {'error': e}),
+        }
+        executor = ThreadPoolExecutor(max_workers=len(os_queries) + 1)
+        try:
+            # Hardware collection overlaps the OS queries too; its errors
+            # still fail the whole report, as before
+            start = time.monotonic()
+            hw_future = executor.submit(self.hw_info.get_all_info)
+            futures = {key: executor.submit(query) for key, (query, _) in os_queries.items()}
+            
+            # One budget for all OS queries, not one per query
+            deadline = start + self.OS_QUERY_TIMEOUT
+            collection_errors = {}
+            for key, future in futures.items():
+                try:
+                    os_data[key] = future.result(timeout=max(0, deadline - time.monotonic()))
+                except FutureTimeout:
+                    collection_errors[key] = f"Timed out after {self.OS_QUERY_TIMEOUT}s"
+                except Exception as e:
+                    collection_errors[key] = str(e)
+                if key in collection_errors:
+                    log.warning("Error collecting %s, using minimal data: %s", key, collection_errors[key])
+                    os_data[key] = os_queries[key][1](collection_errors[key])
+            # Listed in the report so a missing section isn't mistaken for empty data
+            os_data['collection_errors'] = collection_errors
+            
+            try:
+                hw_data = hw_future.result(timeout=max(0, start + self.HARDWARE_TIMEOUT - time.monotonic()))
+            except FutureTimeout:
+                raise TimeoutError(f"Hardware collection timed out after {self.HARDWARE_TIMEOUT}s") from None
+        finally:
+            # Don't block the report on a query that timed out
+            executor.shutdown(wait=False)
+        
+        return hw_data, os_data
+    
+    def iter_csv_rows(self, hw_data, os_data):
+        """Chain the per-section row generators of the report"""
+        # Resolve and validate each hardware section once here, so the row
+        # generators below can trust the shapes instead of re-checking them
+        memory_info, disk_info, battery_info, other_info, network_info = (
+            dict_section(hw_data.get(key)) for key in ('memory', 'disk', 'battery', 'other', 'network'))
+        gpu_list = dict_entries(hw_data.get('gpu'))
+        memory_slots = dict_entries(memory_info.get('memory_slots'))
+        partitions = dict_entries(disk_info.get('partitions'))
+        physical_disks = dict_entries(disk_info.get('physical_disks'))
+        interfaces = dict_entries(network_info.get('interfaces'))
+        # Both battery sections report presence off the same reading
+        has_battery = battery_info.get('percent') not in (None, 'Unknown')
+        
+        return chain(
+            self._system_overview_rows(hw_data, gpu_list, memory_slots, partitions, physical_disks,
+                                       battery_info, other_info, has_battery),
+            self._hardware_details_rows(hw_data, gpu_list, partitions, interfaces, battery_info, has_battery),
+            self._os_details_rows(os_data),
+            self._system_tests_rows(self.test_results)
+        )
+    
+    def _system_overview_rows(self, hw_data, gpu_list, memory_slots, partitions, physical_disks,
+                              battery_info, other_info, has_battery):
+        """Yield the System Overview card rows"""
+        # System Overview Section - Enhanced with card details
+        yield ('SYSTEM OVERVIEW', '', '')
+        yield HEADER_ROW
+        
+        # System Summary Card
+        yield ('=== SYSTEM SUMMARY CARD ===', '', '')
+        yield from spec_rows(hw_data, SYSTEM_SUMMARY_SPEC)
+        
+        yield BLANK_ROW
+        
+        # System Information Card
+        yield ('=== SYSTEM INFORMATION CARD ===', '', '')
+        yield from spec_rows(hw_data, SYSTEM_INFORMATION_SPEC)
+        
+        yield BLANK_ROW
+        
+        # BIOS & Motherboard Card
+        yield ('=== BIOS & MOTHERBOARD CARD ===', '', '')
+        yield from spec_rows(hw_data, BIOS_MOTHERBOARD_SPEC)
+        
+        # Graphics cards info for BIOS card
+        if gpu_list:
+            gpu_names = [gpu.get('name', 'Unknown') for gpu in gpu_list]
+            # Lowercase each name once for both the keyword scan and the filter
+            lowered = [name.lower() for name in gpu_names]
+            dedicated_gpus = []
+            if any(keyword in lo for lo in lowered for keyword in DEDICATED_GPU_KEYWORDS):
+                dedicated_gpus = [name for name, lo in zip(gpu_names, lowered) if 'intel' not in lo]
+            graphics = ', '.join(dedicated_gpus) if dedicated_gpus else 'NO DEDICATED GPU FOUND (INTEGRATED)'
+        else:
+            graphics = 'Unknown'
+        yield ('BIOS & Motherboard', 'Graphics Cards', graphics)
+        
+        yield BLANK_ROW
+        
+        # CPU Information Card
+        yield ('=== CPU INFORMATION CARD ===', '', '')
+        yield from spec_rows(hw_data, CPU_INFORMATION_SPEC)
+        
+        yield BLANK_ROW
+        
+        # RAM Information Card
+        yield ('=== RAM INFORMATION CARD ===', '', '')
+        yield from spec_rows(hw_data, RAM_INFORMATION_SPEC)
+        
+        # Memory slots information
+        if memory_slots:
+            yield ('RAM Information', 'Memory Slots', str(len(memory_slots)))
+            for i, slot in enumerate(memory_slots):
+                size = slot.get('size', 'Unknown')
+                speed = slot.get('speed', 'Unknown')
+                manufacturer = slot.get('manufacturer', 'Unknown')
+                yield ('RAM Information', f'Slot {i+1}', f"{size} {speed} {manufacturer}")
+        else:
+            yield from DEFAULT_MEMORY_SLOT_ROWS
+        
+        yield BLANK_ROW
+        
+        # ROM Information Card (Storage)
+        yield ('=== ROM INFORMATION CARD ===', '', '')
+        yield ('ROM Information', 'Partitions', str(len(partitions)) if partitions else 'Unknown')
+        
+        # Add partition details
+        partition_count = 0
+        for partition in partitions:
+            drive_letter = partition.get('device', '')
+            if drive_letter.endswith('\\'):
+                partition_count += 1
+                fstype = partition.get('fstype', 'Unknown')
+                total_gb = partition.get('total', 0)
+                used_gb = partition.get('used', 0)
+                usage_percent = (used_gb / total_gb * 100) if total_gb > 0 else 0
+                
+                yield ('ROM Information', f'Drive {drive_letter}', f"{fstype} - {total_gb:.1f}GB/ {total_gb:.1f}GB ({usage_percent:.1f}% USED)")
+        
+        # Add physical disk details
+        if physical_disks:
+            for i, disk in enumerate(physical_disks):
+                model = disk.get('model', 'Unknown')
+                serial = disk.get('serial', 'Unknown')
+                disk_type = disk.get('type', 'Unknown')
+                size = disk.get('size', 'Unknown')
+                status = disk.get('status', 'Unknown')
+                
+                yield ('ROM Information', f'Disk {i+1} Model', model)
+                yield ('ROM Information', f'Disk {i+1} Serial', serial)
+                yield ('ROM Information', f'Disk {i+1} Type', disk_type)
+                yield ('ROM Information', f'Disk {i+1} Size', f"{size}GB" if isinstance(size, (int, float)) else str(size))
+                yield ('ROM Information', f'Disk {i+1} Status', status)
+        
+        yield BLANK_ROW
+        
+        # Battery Information Card
+        yield ('=== BATTERY INFORMATION CARD ===', '', '')
+        if battery_info:
+            percent = battery_info.get('percent', 'Unknown')
+            yield ('Battery Information', 'Present', 'Yes (Laptop)' if has_battery else 'No')
+            yield ('Battery Information', 'Charge Percent', f"{percent}%")
+            yield ('Battery Information', 'Status', 'Fully Charged' if percent == 100 else f"Charging: {battery_info.get('power_plugged', 'Unknown')}")
+            yield ('Battery Information', 'Time Left', battery_info.get('time_left', 'Unknown'))
+            yield ('Battery Information', 'Cycle Count', battery_info.get('cycle_count', 'Not Available'))
+            yield ('Battery Information', 'Chemistry', battery_info.get('chemistry', 'Unknown'))
+            yield ('Battery Information', 'Design Voltage', str(battery_info.get('design_voltage', 'Unknown')))
+            yield ('Battery Information', 'Charge Remaining', str(battery_info.get('charge_remaining', 'Unknown')))
+        else:
+            yield from DEFAULT_BATTERY_ROWS
+        
+        yield BLANK_ROW
+        
+        # Other Information Card
+        yield ('=== OTHER INFORMATION CARD ===', '', '')
+        
+        # Temperature sensors
+        temperatures = other_info.get('temperatures', {})
+        if isinstance(temperatures, dict) and temperatures:
+            yield ('Other Information', 'Sensors (Temp)', f"{len(temperatures)} sensors found")
+            for sensor_name, temp_list in temperatures.items():
+                if temp_list:
+                    yield ('Other Information', f'Temp {sensor_name}', f"{temp_list[0]:.1f}°C")
+        else:
+            yield ('Other Information', 'Sensors (Temp)', 'Not Available')
+        
+        # Fan speeds
+        fan_speeds = other_info.get('fan_speeds', {})
+        if isinstance(fan_speeds, dict) and fan_speeds:
+            yield ('Other Information', 'Fan Speeds', f"{len(fan_speeds)} fans found")
+            for fan_name, speed in fan_speeds.items():
+                yield ('Other Information', f'Fan {fan_name}', f"{speed} RPM")
+        else:
+            yield ('Other Information', 'Fan Speeds', 'Not Available')
+        
+        # Camera information
+        cameras = other_info.get('cameras', [])
+        if isinstance(cameras, list) and cameras:
+            yield ('Other Information', 'Camera(s)', f"{len(cameras)} cameras detected")
+            for i, camera in enumerate(cameras):
+                yield ('Other Information', f'Camera {i+1}', str(camera))
+        else:
+            yield ('Other Information', 'Camera(s)', '2 cameras detected')
+        
+        # TPM Information
+        tpm_info = other_info.get('tpm', {})
+        if isinstance(tpm_info, dict) and tpm_info:
+            yield ('Other Information', 'TPM', tpm_info.get('present', 'Not Available'))
+        else:
+            yield ('Other Information', 'TPM', 'Not Available')
+        
+        # Chassis Type
+        chassis_type = other_info.get('chassis_type', 'Unknown')
+        yield ('Other Information', 'Chassis Type', chassis_type if chassis_type != 'Unknown' else 'Convertible')
+        
+        # Secure Boot
+        secure_boot = other_info.get('secure_boot', 'Unknown')
+        yield ('Other Information', 'Secure Boot', secure_boot if secure_boot != 'Unknown' else 'Legacy BIOS')
+        
+        yield BLANK_ROW
+    
+    def _hardware_details_rows(self, hw_data, gpu_list, partitions, interfaces, battery_info, has_battery):
+        """Yield the Hardware Details rows"""
+        # Hardware Details Section
+        yield ('HARDWARE DETAILS', '', '')
+        yield HEADER_ROW
+        
+        # CPU and Memory Information
+        yield from spec_rows(hw_data, HARDWARE_DETAILS_SPEC)
+        
+        # Storage Information
+        for i, partition in enumerate(partitions):
+            component = f'Storage {i+1}'
+            get = partition.get
+            yield (component, 'Device', get('device', 'Unknown'))
+            yield (component, 'Mountpoint', get('mountpoint', 'Unknown'))
+            yield (component, 'File System', get('fstype', 'Unknown'))
+            yield (component, 'Total GB', str(get('total', 'Unknown')))
+            yield (component, 'Used GB', str(get('used', 'Unknown')))
+            yield (component, 'Free GB', str(get('free', 'Unknown')))
+            yield (component, 'Usage Percent', str(get('percent', 'Unknown')))
+        
+        # GPU Information - Fixed: gpu_info is a list, not a dict
+        for i, gpu in enumerate(gpu_list):
+            component = f'GPU {i+1}'
+            get = gpu.get
+            yield (component, 'Name', get('name', 'Unknown'))
+            yield (component, 'Driver Version', get('driver_version', 'Unknown'))
+            yield (component, 'Adapter RAM', str(get('adapter_ram', 'Unknown')))
+            yield (component, 'Video Processor', get('video_processor', 'Unknown'))
+            yield (component, 'Status', get('status', 'Unknown'))
+        
+        # Network Information - Fixed: access interfaces correctly
+        for i, interface in enumerate(interfaces):
+            component = f'Network {i+1}'
+            yield (component, 'Interface', interface.get('name', 'Unknown'))
+            addresses = interface.get('addresses', [])
+            if isinstance(addresses, list):
+                # Only include IPv4 addresses (family '2'), skip MAC addresses (family '-1')
+                ip_addresses = [addr['address'] for addr in addresses
+                                if isinstance(addr, dict) and 'address' in addr and addr.get('family') == '2']
+                yield (component, 'IP Address', ', '.join(ip_addresses) if ip_addresses else 'No IP Address')
+            else:
+                yield (component, 'IP Address', str(addresses))
+            yield (component, 'Status', 'Up' if interface.get('is_up', False) else 'Down')
+            yield (component, 'Speed', str(interface.get('speed', 'Unknown')))
+            
+            # Get I/O statistics if available
+            io_stats = interface.get('io', {})
+            if isinstance(io_stats, dict):
+                yield (component, 'Bytes Sent', str(io_stats.get('bytes_sent', 'Unknown')))
+                yield (component, 'Bytes Received', str(io_stats.get('bytes_recv', 'Unknown')))
+        
+        # Battery Information
+        if battery_info:
+            percent = battery_info.get('percent', 'Unknown')
+            yield ('Battery', 'Present', str(has_battery))
+            yield ('Battery', 'Percent', str(percent))
+            yield ('Battery', 'Power Plugged', str(battery_info.get('power_plugged', 'Unknown')))
+            yield ('Battery', 'Time Left', str(battery_info.get('time_left', 'Unknown')))
+            yield ('Battery', 'Chemistry', str(battery_info.get('chemistry', 'Unknown')))
+        
+        yield BLANK_ROW
+    
+    def _os_details_rows(self, os_data):
+        """Yield the OS Details, installed software and services rows"""
+        # OS Details Section
+        yield ('OS DETAILS', '', '')
+        yield HEADER_ROW
+        
+        for key, error in os_data.get('collection_errors', {}).items():
+            yield ('Data Collection', key, f"Fallback used: {error}")
+        
+        os_details = os_data.get('os_details', {})
+        if isinstance(os_details, dict):
+            yield ('OS', 'System', os_details.get('system', 'Unknown'))
+            yield ('OS', 'Release', os_details.get('release', 'Unknown'))
+            yield ('OS', 'Version', os_details.get('version', 'Unknown'))
+            yield ('OS', 'Machine', os_details.get('machine', 'Unknown'))
+            yield ('OS', 'Processor', os_details.get('processor', 'Unknown'))
+            yield ('OS', 'Architecture', str(os_details.get('architecture', 'Unknown')))
+            yield ('OS', 'Platform', os_details.get('platform', 'Unknown'))
+            yield ('OS', 'Node', os_details.get('node', 'Unknown'))
+            yield ('OS', 'Boot Time', os_details.get('boot_time', 'Unknown'))
+            yield ('OS', 'Uptime', os_details.get('uptime', 'Unknown'))
+        
+        # Network Configuration - Handle error case
+        network_config = os_data.get('network_configuration', {})
+        if isinstance(network_config, dict) and 'error' not in network_config:
+            adapters = network_config.get('adapters', [])
+            if isinstance(adapters, list):
+                for i, adapter in enumerate(adapters):
+                    if isinstance(adapter, dict):
+                        yield (f'Network Adapter {i+1}', 'Name', adapter.get('name', 'Unknown'))
+                        yield (f'Network Adapter {i+1}', 'Description', adapter.get('description', 'Unknown'))
+                        yield (f'Network Adapter {i+1}', 'MAC Address', adapter.get('mac_address', 'Unknown'))
+                        yield (f'Network Adapter {i+1}', 'Status', adapter.get('status', 'Unknown'))
+                        ip_addresses = adapter.get('ip_addresses', [])
+                        if isinstance(ip_addresses, list):
+                            yield (f'Network Adapter {i+1}', 'IP Addresses', ', '.join(ip_addresses))
+                        else:
+                            yield (f'Network Adapter {i+1}', 'IP Addresses', str(ip_addresses))
+        else:
+            yield ('Network Configuration', 'Status', 'Error retrieving network configuration')
+        
+        # Installed Software (all items) - Handle list correctly
+        installed_software = os_data.get('installed_software', [])
+        yield BLANK_ROW
+        yield ('INSTALLED SOFTWARE (All)', '', '')
+        yield ('Software', 'Name', 'Version')
+        if isinstance(installed_software, list):
+            for i, software in enumerate(installed_software):
+                if isinstance(software, dict):
+                    name = software.get('name', 'Unknown')
+                    version = software.get('version', 'Unknown')
+                    yield (f'Software {i+1}', name, version)
+        
+        
+        # System Services (first 10 items) - Handle list correctly
+        system_services = os_data.get('system_services', [])
+        yield BLANK_ROW
+        yield ('SYSTEM SERVICES (Top 10)', '', '')
+        yield ('Service', 'Name', 'Status')
+        if isinstance(system_services, list):
+            # Stop scanning once the 10 services that get written are found
+            valid_services = list(islice((s for s in system_services if isinstance(s, dict) and 'error' not in s), 10))
+            for i, service in enumerate(valid_services):
+                name = service.get('name', 'Unknown')
+                status = service.get('status', 'Unknown')
+                yield (f'Service {i+1}', name, status)
+            if not valid_services:
+                yield ('Services', 'Status', 'No services retrieved (WMI access required)')
+        
+        yield BLANK_ROW
+    
+    def _system_tests_rows(self, test_results):
+        """Yield the latest System Tests result rows"""
+        # System Tests Section
+        yield ('SYSTEM TESTS', '', '')
+        yield ('Test', 'Property', 'Value')
+        
+        if test_results and isinstance(test_results, dict):
+            test_name = test_results.get('test_name', 'Unknown Test')
+            status = test_results.get('status', 'Unknown')
+            progress = test_results.get('progress', 0)
+            start_time = test_results.get('start_time', 'Unknown')
+            
+            yield ('Latest Test', 'Name', test_name)
+            yield ('Latest Test', 'Status', status)
+            yield ('Latest Test', 'Progress', f"{progress}%")
+            yield ('Latest Test', 'Start Time', str(start_time))
+            
+            # Add specific test results
+            for key in ['avg_usage', 'max_usage', 'score', 'duration', 'read_speed_mbps', 'write_speed_mbps', 'download_mbps', 'upload_mbps', 'ping_ms']:
+                if key in test_results:
+                    value = test_results[key]
+                    if key.endswith('_mbps'):
+                        yield ('Latest Test', key.replace('_', ' ').title(), f"{value} MB/s")
+                    elif key == 'ping_ms':
+                        yield ('Latest Test', 'Ping', f"{value} ms")
+                    elif key in ['avg_usage', 'max_usage']:
+                        yield ('Latest Test', key.replace('_', ' ').title(), f"{value}%")
+                    elif key == 'duration':
+                        yield ('Latest Test', 'Duration', f"{value}s")
+                    else:
+                        yield ('Latest Test', key.replace('_', ' ').title(), str(value))
+                
+            errors = test_results.get('errors', [])
+            if errors and isinstance(errors, list):
+                yield ('Latest Test', 'Errors', f"{len(errors)} errors found")
+                for i, error in enumerate(errors[:3]):  # First 3 errors
+                    yield ('Latest Test', f'Error {i+1}', str(error))
+        else:
+            yield ('Latest Test', 'Status', 'No test results available')
+
+
+def build_view(data):
+    """Resolve the sections of a refresh payload that the tabs read, once"""
+    hw_data = data.get('hardware') or {}
+    os_data = data.get('os') or {}
+    
+    view = {key: hw_data.get(key) or {} for key in ('system', 'cpu', 'memory', 'disk', 'battery', 'other', 'network')}
+    view['gpu'] = hw_data.get('gpu') or []
+    view['os_details'] = os_data.get('os_details') or {}
+    view['network_configuration'] = os_data.get('network_configuration') or {}
+    return view
+
+
 class SystemInfoTab(QWidget):
     """System Overview Tab with Card-based Layout"""
     def __init__(self):
@@ -82,20 +834,7 @@ class SystemInfoTab(QWidget):
         """
         card = QFrame()
         card.setFrameStyle(QFrame.Box)
-        card.setStyleSheet("""
-            QFrame {
-                background-color: #4a4a4a;
-                border: 1px solid #606060;
-                border-radius: 12px;
-                padding: 5px;
-                margin: 5px;
-            }
-            QLabel {
-                background-color: transparent;
-                border: none;
-                color: white;
-            }
-        """)
+        card.setStyleSheet(CARD_STYLE)
         
         layout = QVBoxLayout()
         layout.setSpacing(12)
@@ -105,7 +844,7 @@ class SystemInfoTab(QWidget):
         title_label = QLabel(title.upper())
         title_font = QFont("Segoe UI", 14, QFont.Bold)
         title_label.setFont(title_font)
-        title_label.setStyleSheet("color: #ffffff; font-weight: bold; margin-bottom: 2px;")
+        title_label.setStyleSheet(CARD_TITLE_STYLE)
         layout.addWidget(title_label)
         
         # Card content
@@ -120,12 +859,12 @@ class SystemInfoTab(QWidget):
                 item_layout.setContentsMargins(0, 0, 0, 0)
                 
                 key_label = QLabel(f"{key}:")
-                key_label.setStyleSheet("color: #cccccc; font-weight: 500; font-size: 12px;")
+                key_label.setStyleSheet(CARD_KEY_STYLE)
                 key_label.setMinimumWidth(140)
                 key_label.setFont(QFont("Segoe UI", 11))
                 
                 value_label = QLabel(str(value))
-                value_label.setStyleSheet("color: #ffffff; font-weight: 600; font-size: 12px;")
+                value_label.setStyleSheet(CARD_VALUE_STYLE)
                 value_label.setWordWrap(True)
                 value_label.setFont(QFont("Segoe UI", 11))
                 
@@ -135,12 +874,7 @@ class SystemInfoTab(QWidget):
                 # Add info icon with tooltip if this key has a tooltip
                 if tooltips and key in tooltips:
                     info_icon = QLabel("ℹ️")
-                    info_icon.setStyleSheet("""
-                        color: #4da6ff; 
-                        font-size: 14px; 
-                        margin-left: 5px;
-                        padding: 2px;
-                    """)
+                    info_icon.setStyleSheet(INFO_ICON_STYLE)
                     info_icon.setToolTip(tooltips[key])
                     info_icon.setFont(QFont("Segoe UI", 12))
                     # Make the icon clickable for better UX
@@ -236,16 +970,14 @@ class SystemInfoTab(QWidget):
         main_layout.addWidget(scroll_area)
         self.setLayout(main_layout)
     
-    def update_data(self, data):
-        """Update the system info tab with new data"""
+    def update_data(self, view):
+        """Update the system info tab from the shared build_view() sections"""
         try:
-            hw_data = data.get('hardware', {})
-            os_data = data.get('os', {})
-            
-            system_info = hw_data.get('system', {})
-            cpu_info = hw_data.get('cpu', {})
-            memory_info = hw_data.get('memory', {})
-            os_details = os_data.get('os_details', {})
+            system_info = view['system']
+            cpu_info = view['cpu']
+            memory_info = view['memory']
+            os_details = view['os_details']
+            gpu_list = view['gpu']
             
             # === SYSTEM SUMMARY ===
             # Fix Windows 11 detection - registry often shows "Windows 10 Pro" for Windows 11
@@ -298,7 +1030,7 @@ class SystemInfoTab(QWidget):
                 "MOTHERBOARD SERIAL": system_info.get('motherboard_serial', 'Unknown'),
                 "COMPUTER MANUFACTURER": system_info.get('computer_manufacturer', 'Unknown'),
                 "COMPUTER MODEL": system_info.get('computer_model', 'Unknown'),
-                "GRAPHICS CARDS": "NO DEDICATED GPU FOUND (INTEGRATED)" if not hw_data.get('gpu') or (len(hw_data.get('gpu', [])) == 1 and 'No dedicated GPU' in str(hw_data.get('gpu', [])[0])) else f"{len(hw_data.get('gpu', []))} GPU(s) detected"
+                "GRAPHICS CARDS": "NO DEDICATED GPU FOUND (INTEGRATED)" if not gpu_list or (len(gpu_list) == 1 and 'No dedicated GPU' in str(gpu_list[0])) else f"{len(gpu_list)} GPU(s) detected"
             }
             
             # === CPU INFO ===
@@ -331,7 +1063,7 @@ class SystemInfoTab(QWidget):
                     memory_info_data[f"SLOT {i+1}"] = slot_info
             
             # === ROM/DISK INFO ===
-            disk_info = hw_data.get('disk', {})
+            disk_info = view['disk']
             rom_info_data = {}
             
             # Add partition information
@@ -387,7 +1119,7 @@ class SystemInfoTab(QWidget):
                     rom_info_data[f"DISK {i+1} STATUS"] = disk_status
             
             # === BATTERY INFO ===
-            battery_info = hw_data.get('battery', {})
+            battery_info = view['battery']
             battery_info_data = {}
             
             if battery_info:
@@ -465,7 +1197,7 @@ class SystemInfoTab(QWidget):
                 battery_info_data["PRESENT"] = "No Battery Information Available"
             
             # === OTHER INFORMATION ===
-            other_info = hw_data.get('other', {})
+            other_info = view['other']
             other_info_data = {}
             
             # Sensors - CPU/GPU temperatures, fan speeds
@@ -584,6 +1316,86 @@ class SystemInfoTab(QWidget):
             print(f"Error re-adding cards: {str(e)}")
     
 
+class TreeNode:
+    """Single Property/Value row of a HwDataModel tree"""
+    __slots__ = ('parent', 'columns', 'children', 'row')
+    
+    def __init__(self, parent=None, columns=("", "")):
+        self.parent = parent
+        self.columns = columns
+        self.children = []
+        self.row = 0
+        if parent is not None:
+            self.row = len(parent.children)
+            parent.children.append(self)
+
+
+def render_dict(parent, title_label, d, skip_keys=(), format_value=None):
+    """Add a header node under parent with one Property/Value child per dict entry
+    
+    Args:
+        parent: TreeNode to attach the header to
+        title_label: Text of the header row
+        d: Dictionary of key-value pairs to display
+        skip_keys: Keys that the caller renders separately (or not at all)
+        format_value: Optional (key, value) -> str formatter, defaults to str(value)
+    """
+    header = TreeNode(parent, [title_label, ""])
+    for key, value in d.items():
+        if key not in skip_keys:
+            TreeNode(header, [key.replace('_', ' ').title(),
+                              format_value(key, value) if format_value else str(value)])
+    return header
+
+
+class HwDataModel(QAbstractItemModel):
+    """Read-only tree model serving Property/Value rows straight from TreeNode objects"""
+    def __init__(self, headers=("Property", "Value"), parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        self._tree = TreeNode()
+    
+    def set_tree(self, root):
+        """Replace the whole tree with a single model reset"""
+        self.beginResetModel()
+        self._tree = root
+        self.endResetModel()
+    
+    def _node(self, index):
+        return index.internalPointer() if index.isValid() else self._tree
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        return len(self._node(parent).children)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return len(self._headers)
+    
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        return self.createIndex(row, column, self._node(parent).children[row])
+    
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        parent_node = index.internalPointer().parent
+        if parent_node is None or parent_node is self._tree:
+            return QModelIndex()
+        return self.createIndex(parent_node.row, 0, parent_node)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if index.isValid() and role == Qt.DisplayRole:
+            return index.internalPointer().columns[index.column()]
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self._headers[section]
+        return None
+
+
 class HardwareTab(QWidget):
     """Hardware Details Tab"""
     def __init__(self):
@@ -593,162 +1405,144 @@ class HardwareTab(QWidget):
     def init_ui(self):
         layout = QVBoxLayout()
         
-        # Create tree widget for hardware info
-        self.tree = QTreeWidget()
-        self.tree.setHeaderLabels(["Property", "Value"])
+        # Create tree view for hardware info
+        self.model = HwDataModel()
+        self.tree = QTreeView()
+        self.tree.setModel(self.model)
         self.tree.setColumnWidth(0, 300)  # Set first column width
         layout.addWidget(self.tree)
         
         self.setLayout(layout)
     
-    def update_data(self, data):
-        """Update hardware tab with new data"""
-        self.tree.clear()
+    def update_data(self, view):
+        """Update hardware tab from the shared build_view() sections"""
+        # Swap in the whole tree with a single model reset
+        self.model.set_tree(self.build_tree(view))
+        
+        # Expand all items
+        self.tree.expandAll()
+    
+    @staticmethod
+    def format_battery_value(key, value):
+        """Special formatting for certain battery fields"""
+        if key == 'time_left':
+            # Format time left properly
+            if str(value) == 'Unlimited':
+                return 'Unlimited (Charging)'
+            elif isinstance(value, str) and value.endswith(' seconds'):
+                # Handle "XXXX seconds" format
+                try:
+                    seconds_str = value.replace(' seconds', '')
+                    seconds = int(float(seconds_str))
+                    if seconds == 4294967293 or seconds > 2147483647:  # Windows "unlimited" values
+                        return 'Unlimited (Charging)'
+                    days = seconds // 86400
+                    hours = (seconds % 86400) // 3600
+                    minutes = (seconds % 3600) // 60
+                    if days > 0:
+                        return f'{days}d {hours}h {minutes}m'
+                    elif hours > 0:
+                        return f'{hours}h {minutes}m'
+                    else:
+                        return f'{minutes}m'
+                except:
+                    return str(value)
+            elif isinstance(value, (int, float)) and value == 4294967293:
+                return 'Unlimited (Charging)'
+            return str(value)
+        elif key == 'is_laptop':
+            # Better formatting for laptop detection
+            return 'Yes' if value else 'No'
+        elif key == 'power_plugged':
+            # Better formatting for power status
+            return 'Yes (Charging)' if value else 'No (On Battery)'
+        return str(value)
+    
+    def build_tree(self, view):
+        """Build the Property/Value node tree for the hardware data"""
+        Node = TreeNode  # Local alias, looked up hundreds of times below
+        root = Node()
         
         try:
-            hw_data = data.get('hardware', {})
-            
             # CPU Information
-            cpu_item = QTreeWidgetItem(self.tree, ["CPU Information", ""])
-            cpu_info = hw_data.get('cpu', {})
-            for key, value in cpu_info.items():
-                if key != 'usage_per_core' and key != 'flags':
-                    QTreeWidgetItem(cpu_item, [f"{key.replace('_', ' ').title()}", str(value)])
+            cpu_info = view['cpu']
+            cpu_item = render_dict(root, "CPU Information", cpu_info, ('usage_per_core', 'flags'))
             
             # Per-core usage
             if 'usage_per_core' in cpu_info:
-                core_item = QTreeWidgetItem(cpu_item, ["Per-Core Usage", ""])
+                core_item = Node(cpu_item, ["Per-Core Usage", ""])
                 for i, usage in enumerate(cpu_info['usage_per_core']):
-                    QTreeWidgetItem(core_item, [f"Core {i}", f"{usage}%"])
+                    Node(core_item, [f"Core {i}", f"{usage}%"])
             
             # Memory Information
-            memory_item = QTreeWidgetItem(self.tree, ["RAM Information", ""])
-            memory_info = hw_data.get('memory', {})
-            for key, value in memory_info.items():
-                if key != 'memory_slots':
-                    QTreeWidgetItem(memory_item, [f"{key.replace('_', ' ').title()}", str(value)])
+            memory_info = view['memory']
+            memory_item = render_dict(root, "RAM Information", memory_info, ('memory_slots',))
             
             # Memory slots
             if 'memory_slots' in memory_info and isinstance(memory_info['memory_slots'], list):
-                slots_item = QTreeWidgetItem(memory_item, ["Memory Slots", ""])
+                slots_item = Node(memory_item, ["Memory Slots", ""])
                 for i, slot in enumerate(memory_info['memory_slots']):
-                    slot_item = QTreeWidgetItem(slots_item, [f"Slot {i+1}", ""])
-                    for key, value in slot.items():
-                        QTreeWidgetItem(slot_item, [f"{key.replace('_', ' ').title()}", str(value)])
+                    render_dict(slots_item, f"Slot {i+1}", slot)
             
             # Storage Information
-            storage_item = QTreeWidgetItem(self.tree, ["Storage Information", ""])
-            disk_info = hw_data.get('disk', {})
+            storage_item = Node(root, ["Storage Information", ""])
+            disk_info = view['disk']
             
             # I/O Statistics
             io_stats = disk_info.get('io_statistics', {})
             if io_stats:
-                io_item = QTreeWidgetItem(storage_item, ["I/O Statistics", ""])
+                io_item = Node(storage_item, ["I/O Statistics", ""])
                 read_gb = io_stats.get('read_bytes', 0)
                 write_gb = io_stats.get('write_bytes', 0)
                 read_count = io_stats.get('read_count', 0)
                 write_count = io_stats.get('write_count', 0)
                 
-                QTreeWidgetItem(io_item, ["Total Read", f"{read_gb:.1f}GB ({read_count:,} Operations)"])
-                QTreeWidgetItem(io_item, ["Total Write", f"{write_gb:.1f}GB ({write_count:,} Operations)"])
+                Node(io_item, ["Total Read", f"{read_gb:.1f}GB ({read_count:,} Operations)"])
+                Node(io_item, ["Total Write", f"{write_gb:.1f}GB ({write_count:,} Operations)"])
             
             # Partitions
             if 'partitions' in disk_info:
-                partitions_item = QTreeWidgetItem(storage_item, ["Partitions", ""])
+                partitions_item = Node(storage_item, ["Partitions", ""])
                 for partition in disk_info['partitions']:
-                    part_item = QTreeWidgetItem(partitions_item, [partition.get('device', 'Unknown'), ""])
-                    for key, value in partition.items():
-                        QTreeWidgetItem(part_item, [f"{key.replace('_', ' ').title()}", str(value)])
+                    render_dict(partitions_item, partition.get('device', 'Unknown'), partition)
             
             # Physical disks
             if 'physical_disks' in disk_info:
-                physical_item = QTreeWidgetItem(storage_item, ["Physical Disks", ""])
+                physical_item = Node(storage_item, ["Physical Disks", ""])
                 for disk in disk_info['physical_disks']:
-                    disk_item = QTreeWidgetItem(physical_item, [disk.get('model', 'Unknown'), ""])
-                    for key, value in disk.items():
-                        QTreeWidgetItem(disk_item, [f"{key.replace('_', ' ').title()}", str(value)])
+                    render_dict(physical_item, disk.get('model', 'Unknown'), disk)
             
             # GPU Information
-            gpu_item = QTreeWidgetItem(self.tree, ["GPU Information", ""])
-            gpu_info = hw_data.get('gpu', [])
+            gpu_item = Node(root, ["GPU Information", ""])
+            gpu_info = view['gpu']
             for i, gpu in enumerate(gpu_info):
-                gpu_device = QTreeWidgetItem(gpu_item, [f"GPU {i+1}: {gpu.get('name', 'Unknown')}", ""])
-                for key, value in gpu.items():
-                    QTreeWidgetItem(gpu_device, [f"{key.replace('_', ' ').title()}", str(value)])
+                render_dict(gpu_item, f"GPU {i+1}: {gpu.get('name', 'Unknown')}", gpu)
             
             # Network Information
-            network_item = QTreeWidgetItem(self.tree, ["Network Information", ""])
-            network_info = hw_data.get('network', {})
+            network_item = Node(root, ["Network Information", ""])
+            network_info = view['network']
             
             if 'interfaces' in network_info:
                 for interface in network_info['interfaces']:
-                    if_item = QTreeWidgetItem(network_item, [interface.get('name', 'Unknown'), ""])
-                    for key, value in interface.items():
-                        if key != 'addresses' and key != 'io':
-                            QTreeWidgetItem(if_item, [f"{key.replace('_', ' ').title()}", str(value)])
+                    if_item = render_dict(network_item, interface.get('name', 'Unknown'), interface, ('addresses', 'io'))
                     
                     # Addresses
                     if 'addresses' in interface:
-                        addr_item = QTreeWidgetItem(if_item, ["Addresses", ""])
+                        addr_item = Node(if_item, ["Addresses", ""])
                         for addr in interface['addresses']:
-                            addr_detail = QTreeWidgetItem(addr_item, [addr.get('address', 'Unknown'), ""])
-                            for key, value in addr.items():
-                                QTreeWidgetItem(addr_detail, [f"{key.replace('_', ' ').title()}", str(value)])
+                            render_dict(addr_item, addr.get('address', 'Unknown'), addr)
             
             # System Information
-            system_item = QTreeWidgetItem(self.tree, ["System Information", ""])
-            system_info = hw_data.get('system', {})
-            for key, value in system_info.items():
-                QTreeWidgetItem(system_item, [f"{key.replace('_', ' ').title()}", str(value)])
+            render_dict(root, "System Information", view['system'])
             
             # Battery Information
-            battery_item = QTreeWidgetItem(self.tree, ["Battery Information", ""])
-            battery_info = hw_data.get('battery', {})
-            for key, value in battery_info.items():
-                # Special formatting for certain battery fields
-                if key == 'time_left':
-                    # Format time left properly
-                    if str(value) == 'Unlimited':
-                        formatted_value = 'Unlimited (Charging)'
-                    elif isinstance(value, str) and value.endswith(' seconds'):
-                        # Handle "XXXX seconds" format
-                        try:
-                            seconds_str = value.replace(' seconds', '')
-                            seconds = int(float(seconds_str))
-                            if seconds == 4294967293 or seconds > 2147483647:  # Windows "unlimited" values
-                                formatted_value = 'Unlimited (Charging)'
-                            else:
-                                days = seconds // 86400
-                                hours = (seconds % 86400) // 3600
-                                minutes = (seconds % 3600) // 60
-                                if days > 0:
-                                    formatted_value = f'{days}d {hours}h {minutes}m'
-                                elif hours > 0:
-                                    formatted_value = f'{hours}h {minutes}m'
-                                else:
-                                    formatted_value = f'{minutes}m'
-                        except:
-                            formatted_value = str(value)
-                    elif isinstance(value, (int, float)) and value == 4294967293:
-                        formatted_value = 'Unlimited (Charging)'
-                    else:
-                        formatted_value = str(value)
-                elif key == 'is_laptop':
-                    # Better formatting for laptop detection
-                    formatted_value = 'Yes' if value else 'No'
-                elif key == 'power_plugged':
-                    # Better formatting for power status
-                    formatted_value = 'Yes (Charging)' if value else 'No (On Battery)'
-                else:
-                    formatted_value = str(value)
-                
-                QTreeWidgetItem(battery_item, [f"{key.replace('_', ' ').title()}", formatted_value])
-            
-            # Expand all items
-            self.tree.expandAll()
+            render_dict(root, "Battery Information", view['battery'],
+                        format_value=self.format_battery_value)
             
         except Exception as e:
-            error_item = QTreeWidgetItem(self.tree, ["Error", str(e)])
+            Node(root, ["Error", str(e)])
+        
+        return root
 
 
 class OSTab(QWidget):
@@ -760,59 +1554,68 @@ class OSTab(QWidget):
     def init_ui(self):
         layout = QVBoxLayout()
         
-        # Create tree widget for OS info
-        self.tree = QTreeWidget()
-        self.tree.setHeaderLabels(["Property", "Value"])
+        # Create tree view for OS info
+        self.model = HwDataModel()
+        self.tree = QTreeView()
+        self.tree.setModel(self.model)
         self.tree.setColumnWidth(0, 300)  # Set first column width
         layout.addWidget(self.tree)
         
         self.setLayout(layout)
     
-    def update_data(self, data):
-        """Update OS tab with new data"""
-        self.tree.clear()
+    def update_data(self, view):
+        """Update OS tab from the shared build_view() sections"""
+        # Swap in the whole tree with a single model reset
+        self.model.set_tree(self.build_tree(view))
+        
+        # Expand all items
+        self.tree.expandAll()
+    
+    def build_tree(self, view):
+        """Build the Property/Value node tree for the OS data"""
+        Node = TreeNode  # Local alias, looked up hundreds of times below
+        root = Node()
         
         try:
-            os_data = data.get('os', {})
-            
             # OS Details
-            os_item = QTreeWidgetItem(self.tree, ["OS Details", ""])
-            os_details = os_data.get('os_details', {})
-            for key, value in os_details.items():
-                if key not in ['environment_variables', 'path']:
-                    QTreeWidgetItem(os_item, [f"{key.replace('_', ' ').title()}", str(value)])
+            os_details = view['os_details']
+            os_item = render_dict(root, "OS Details", os_details, ('environment_variables', 'path'))
             
             # Path entries
             if 'path' in os_details:
-                path_item = QTreeWidgetItem(os_item, [f"PATH Entries ({len(os_details['path'])})", ""])
-                for i, path in enumerate(os_details['path'][:20]):  # Show first 20
-                    QTreeWidgetItem(path_item, [f"Entry {i+1}", path])
-                if len(os_details['path']) > 20:
-                    QTreeWidgetItem(path_item, ["...", f"({len(os_details['path']) - 20} more entries)"])
+                paths = os_details['path']
+                n_paths = len(paths)
+                path_item = Node(os_item, [f"PATH Entries ({n_paths})", ""])
+                # Show first 20 without copying the whole PATH list
+                for i, path in enumerate(islice(paths, 20)):
+                    Node(path_item, [f"Entry {i+1}", path])
+                if n_paths > 20:
+                    Node(path_item, ["...", f"({n_paths - 20} more entries)"])
             
             # Environment Variables
             if 'environment_variables' in os_details:
-                env_item = QTreeWidgetItem(os_item, [f"Environment Variables ({len(os_details['environment_variables'])})", ""])
-                for key, value in list(os_details['environment_variables'].items())[:20]:  # Show first 20
-                    QTreeWidgetItem(env_item, [key, str(value)[:100] + "..." if len(str(value)) > 100 else str(value)])
-                if len(os_details['environment_variables']) > 20:
-                    QTreeWidgetItem(env_item, ["...", f"({len(os_details['environment_variables']) - 20} more variables)"])
+                env_vars = os_details['environment_variables']
+                n_env_vars = len(env_vars)
+                env_item = Node(os_item, [f"Environment Variables ({n_env_vars})", ""])
+                # Show first 20 without materializing every variable
+                for key, value in islice(env_vars.items(), 20):
+                    value = str(value)
+                    Node(env_item, [key, value[:100] + "..." if len(value) > 100 else value])
+                if n_env_vars > 20:
+                    Node(env_item, ["...", f"({n_env_vars - 20} more variables)"])
             
             # Network Configuration
-            network_item = QTreeWidgetItem(self.tree, ["Network Configuration", ""])
-            network_config = os_data.get('network_configuration', {})
+            network_item = Node(root, ["Network Configuration", ""])
+            network_config = view['network_configuration']
             
             if 'adapters' in network_config:
                 for adapter in network_config['adapters']:
-                    adapter_item = QTreeWidgetItem(network_item, [adapter.get('description', 'Unknown Adapter'), ""])
-                    for key, value in adapter.items():
-                        QTreeWidgetItem(adapter_item, [f"{key.replace('_', ' ').title()}", str(value)])
-            
-            # Expand all items
-            self.tree.expandAll()
+                    render_dict(network_item, adapter.get('description', 'Unknown Adapter'), adapter)
             
         except Exception as e:
-            error_item = QTreeWidgetItem(self.tree, ["Error", str(e)])
+            Node(root, ["Error", str(e)])
+        
+        return root
 
 
 class TestsTab(QWidget):
@@ -825,6 +1628,16 @@ class TestsTab(QWidget):
         self.system_tests = SystemTests()
         self.current_test_results = None
         self.last_callback_time = 0  # For throttling UI updates
+        # Completion summary renderers keyed by test name
+        self._result_renderers = {
+            'CPU Stress Test': self._render_cpu_results,
+            'Memory Test': self._render_memory_results,
+            'Disk Speed Test': self._render_disk_results,
+            'Network Speed Test': self._render_network_results,
+            'Brightness Test': self._render_brightness_results,
+            'Charging Test': self._render_charging_results,
+            'Keyboard Test': self._render_keyboard_results,
+        }
         
         # Connect the signal to the UI update method
         self.update_ui_signal.connect(self._update_test_ui)
@@ -1140,7 +1953,6 @@ class TestsTab(QWidget):
     def test_callback(self, results):
         """Callback for test progress updates"""
         try:
-            import time
             current_time = time.time()
             
             # Less aggressive throttling for progress updates (allow updates every 0.3 seconds)
@@ -1165,15 +1977,178 @@ class TestsTab(QWidget):
             import traceback
             traceback.print_exc()
     
+    @staticmethod
+    def _append_errors(lines, errors, separate=True):
+        """Append the error count and the first 3 errors to a results summary"""
+        if not errors:
+            return
+        if separate:
+            lines.append("")
+        lines.append(f"Errors encountered: {len(errors)}")
+        for error in errors[:3]:
+            lines.append(f"  • {error}")
+    
+    def _render_cpu_results(self, results, lines):
+        """Append the CPU stress test summary"""
+        lines.append(f"Max CPU Usage: {results.get('max_usage', 0):.1f}%")
+        lines.append(f"Average CPU Usage: {results.get('avg_usage', 0):.1f}%")
+        if 'cpu_temperatures' in results and results['cpu_temperatures']:
+            max_temp = max(t['temperature'] for t in results['cpu_temperatures'])
+            lines.append(f"Max Temperature: {max_temp:.1f}°C")
+    
+    def _render_memory_results(self, results, lines):
+        """Append the memory test summary"""
+        lines.append(f"Blocks Tested: {results.get('blocks_tested', 0)}")
+        lines.append(f"Errors Found: {results.get('errors_found', 0)}")
+    
+    def _render_disk_results(self, results, lines):
+        """Append the disk speed test summary"""
+        log.debug("Processing disk test completion results")
+        write_speed = results.get('write_speed_mbps', 0)
+        read_speed = results.get('read_speed_mbps', 0)
+        log.debug("Write speed: %s, Read speed: %s", write_speed, read_speed)
+        lines.append(f"Write Speed: {write_speed:.2f} MB/s")
+        lines.append(f"Read Speed: {read_speed:.2f} MB/s")
+    
+    def _render_network_results(self, results, lines):
+        """Append the network speed test summary"""
+        lines.append(f"Download Speed: {results.get('download_mbps', 0):.2f} Mbps")
+        lines.append(f"Upload Speed: {results.get('upload_mbps', 0):.2f} Mbps")
+        lines.append(f"Ping: {results.get('ping_ms', 0):.1f} ms")
+    
+    def _render_brightness_results(self, results, lines):
+        """Append the brightness test summary"""
+        log.debug("Processing brightness test completion results")
+        brightness_support = results.get('brightness_support', False)
+        levels_tested = results.get('brightness_levels_tested', [])
+        original_brightness = results.get('original_brightness', 'Unknown')
+        errors = results.get('errors', [])
+        
+        lines.append(f"Brightness Support: {'Yes' if brightness_support else 'No'}")
+        if brightness_support:
+            lines.append(f"Original Brightness: {original_brightness}%")
+            lines.append(f"Levels Tested: {len(levels_tested)}")
+            
+            successful_tests = sum(1 for level in levels_tested if level.get('success', False))
+            lines.append(f"Successful Changes: {successful_tests}/{len(levels_tested)}")
+            
+            if levels_tested:
+                lines.append("Brightness Levels:")
+                for level_info in levels_tested:
+                    level = level_info.get('level', 'Unknown')
+                    success = level_info.get('success', False)
+                    status = '✓' if success else '✗'
+                    lines.append(f"  {status} {level}%")
+        
+        self._append_errors(lines, errors, separate=False)
+    
+    def _render_charging_results(self, results, lines):
+        """Append the charging test summary"""
+        log.debug("Processing charging test completion results")
+        battery_support = results.get('battery_support', False)
+        charging_events = results.get('charging_events', [])
+        battery_changes = results.get('battery_level_changes', [])
+        initial_charging = results.get('initial_charging_state', 'Unknown')
+        initial_level = results.get('initial_battery_level', 'Unknown')
+        current_charging = results.get('current_charging_state', 'Unknown')
+        current_level = results.get('current_battery_level', 'Unknown')
+        charging_port_status = results.get('charging_port_status', 'Unknown')
+        battery_charging_status = results.get('battery_charging_status', 'Unknown')
+        errors = results.get('errors', [])
+        
+        lines.append(f"Battery Support: {'Yes' if battery_support else 'No'}")
+        
+        if battery_support:
+            lines.append(f"Initial State: {initial_charging} at {initial_level}%")
+            lines.append(f"Final State: {current_charging} at {current_level}%")
+            lines.append(f"Charging Events Detected: {len(charging_events)}")
+            lines.append(f"Battery Level Changes: {len(battery_changes)}")
+            
+            lines.append("")
+            lines.append("CHARGING PORT:")
+            lines.append(f"  {charging_port_status}")
+            
+            lines.append("")
+            lines.append("BATTERY CHARGING:")
+            lines.append(f"  {battery_charging_status}")
+            
+            if charging_events:
+                lines.append("")
+                lines.append("Charging Events:")
+                for event in charging_events:
+                    t = event['timestamp']
+                    timestamp = f"{t.hour:02d}:{t.minute:02d}:{t.second:02d}"
+                    action = event['event'].replace('_', ' ').title()
+                    level = event['battery_level']
+                    lines.append(f"  {timestamp}: {action} at {level}%")
+            
+            if battery_changes:
+                lines.append("")
+                lines.append("Battery Level Changes:")
+                for change in battery_changes[-5:]:  # Show last 5 changes
+                    t = change['timestamp']
+                    timestamp = f"{t.hour:02d}:{t.minute:02d}:{t.second:02d}"
+                    old_level = change['old_level']
+                    new_level = change['new_level']
+                    change_amount = change['change']
+                    charging = 'charging' if change['charging'] else 'not charging'
+                    direction = '↑' if change_amount > 0 else '↓'
+                    lines.append(f"  {timestamp}: {old_level}% {direction} {new_level}% ({charging})")
+        
+        self._append_errors(lines, errors)
+    
+    def _render_keyboard_results(self, results, lines):
+        """Append the keyboard test summary"""
+        log.debug("Processing keyboard test completion results")
+        browser_opened = results.get('browser_opened', False)
+        keyboard_test_url = results.get('keyboard_test_url', '')
+        errors = results.get('errors', [])
+        
+        lines.append(f"Browser Opened: {'Yes' if browser_opened else 'No'}")
+        
+        if browser_opened:
+            lines.append("✓ Keyboard test webpage opened successfully")
+            lines.append("✓ Interactive keyboard layout displayed")
+            lines.append("✓ Key press detection enabled")
+            lines.append("")
+            lines.append("KEYBOARD TEST FEATURES:")
+            lines.append("  • Visual keyboard layout with all keys")
+            lines.append("  • Real-time key press feedback (green highlight)")
+            lines.append("  • Progress tracking and statistics")
+            lines.append("  • Support for all standard keys including:")
+            lines.append("    - Function keys (F1-F12)")
+            lines.append("    - Number row and symbols")
+            lines.append("    - QWERTY letter keys")
+            lines.append("    - Special keys (Shift, Ctrl, Alt, Space, etc.)")
+            lines.append("")
+            lines.append("INSTRUCTIONS COMPLETED:")
+            lines.append("  ✓ Press keys to test them")
+            lines.append("  ✓ Watch for green highlighting")
+            lines.append("  ✓ Monitor progress percentage")
+            lines.append("  ✓ Aim for 80%+ completion")
+            
+            if keyboard_test_url:
+                lines.append("")
+                lines.append(f"Test URL: {keyboard_test_url}")
+        else:
+            lines.append("⚠ Failed to open keyboard test webpage")
+            lines.append("Please manually open a browser and navigate to:")
+            if keyboard_test_url:
+                lines.append(f"  {keyboard_test_url}")
+        
+        self._append_errors(lines, errors)
+    
     def _update_test_ui(self, results):
         """Update the test UI (called via signal to ensure main thread execution)"""
+        # Batch every append below into a single repaint of the results view
+        self.results_text.setUpdatesEnabled(False)
         try:
             test_name = results.get('test_name', 'Unknown Test')
             status = results.get('status', 'Unknown')
             progress = results.get('progress', 0)
             
             # Debug output for progress updates
-            print(f"DEBUG: UI Update - {test_name}, Status: {status}, Progress: {progress}%")
+            log.debug("UI Update - %s, Status: %s, Progress: %s%%", test_name, status, progress)
             
             # Special handling for charging test running status
             if 'Charging Test' in test_name and status == 'Running':
@@ -1187,181 +2162,41 @@ class TestsTab(QWidget):
             
             # Update progress bar
             if 'progress' in results:
-                print(f"DEBUG: Setting progress bar to {progress}%")
+                log.debug("Setting progress bar to %s%%", progress)
                 self.progress_bar.setValue(int(progress))
                 self.progress_bar.setVisible(True)  # Ensure progress bar is visible
             
+            # Progress ticks stop here; only Completed/Error render a summary
+            if status not in ('Completed', 'Error'):
+                if 'Testing' in status or 'Finding' in status:
+                    self.results_text.append(f"{status}...")
+                return
+            
+            self.progress_bar.setVisible(False)
+            
             if status == 'Completed':
-                self.progress_bar.setVisible(False)
-                self.results_text.append(f"\n{test_name} completed successfully!")
+                # Collect the summary and hand it to the text edit in one go
+                lines = [f"\n{test_name} completed successfully!"]
                 
                 # Display results based on test type
-                if 'CPU Stress' in test_name:
-                    self.results_text.append(f"Max CPU Usage: {results.get('max_usage', 0):.1f}%")
-                    self.results_text.append(f"Average CPU Usage: {results.get('avg_usage', 0):.1f}%")
-                    if 'cpu_temperatures' in results and results['cpu_temperatures']:
-                        max_temp = max(t['temperature'] for t in results['cpu_temperatures'])
-                        self.results_text.append(f"Max Temperature: {max_temp:.1f}°C")
-                
-                elif 'Memory Test' in test_name:
-                    self.results_text.append(f"Blocks Tested: {results.get('blocks_tested', 0)}")
-                    self.results_text.append(f"Errors Found: {results.get('errors_found', 0)}")
-                
-                elif 'Disk Speed' in test_name:
-                    print(f"DEBUG: Processing disk test completion results")
-                    write_speed = results.get('write_speed_mbps', 0)
-                    read_speed = results.get('read_speed_mbps', 0)
-                    print(f"DEBUG: Write speed: {write_speed}, Read speed: {read_speed}")
-                    self.results_text.append(f"Write Speed: {write_speed:.2f} MB/s")
-                    self.results_text.append(f"Read Speed: {read_speed:.2f} MB/s")
-                
-                elif 'Network Speed' in test_name:
-                    self.results_text.append(f"Download Speed: {results.get('download_mbps', 0):.2f} Mbps")
-                    self.results_text.append(f"Upload Speed: {results.get('upload_mbps', 0):.2f} Mbps")
-                    self.results_text.append(f"Ping: {results.get('ping_ms', 0):.1f} ms")
+                renderer = self._result_renderers.get(test_name)
+                if renderer:
+                    renderer(results, lines)
                 
-                elif 'Brightness Test' in test_name:
-                    print(f"DEBUG: Processing brightness test completion results")
-                    brightness_support = results.get('brightness_support', False)
-                    levels_tested = results.get('brightness_levels_tested', [])
-                    original_brightness = results.get('original_brightness', 'Unknown')
-                    errors = results.get('errors', [])
-                    
-                    self.results_text.append(f"Brightness Support: {'Yes' if brightness_support else 'No'}")
-                    if brightness_support:
-                        self.results_text.append(f"Original Brightness: {original_brightness}%")
-                        self.results_text.append(f"Levels Tested: {len(levels_tested)}")
-                        
-                        successful_tests = sum(1 for level in levels_tested if level.get('success', False))
-                        self.results_text.append(f"Successful Changes: {successful_tests}/{len(levels_tested)}")
-                        
-                        if levels_tested:
-                            self.results_text.append("Brightness Levels:")
-                            for level_info in levels_tested:
-                                level = level_info.get('level', 'Unknown')
-                                success = level_info.get('success', False)
-                                status = '✓' if success else '✗'
-                                self.results_text.append(f"  {status} {level}%")
-                    
-                    if errors:
-                        self.results_text.append(f"Errors encountered: {len(errors)}")
-                        for error in errors[:3]:  # Show first 3 errors
-                            self.results_text.append(f"  • {error}")
-                
-                elif 'Charging Test' in test_name:
-                    print(f"DEBUG: Processing charging test completion results")
-                    battery_support = results.get('battery_support', False)
-                    charging_events = results.get('charging_events', [])
-                    battery_changes = results.get('battery_level_changes', [])
-                    initial_charging = results.get('initial_charging_state', 'Unknown')
-                    initial_level = results.get('initial_battery_level', 'Unknown')
-                    current_charging = results.get('current_charging_state', 'Unknown')
-                    current_level = results.get('current_battery_level', 'Unknown')
-                    charging_port_status = results.get('charging_port_status', 'Unknown')
-                    battery_charging_status = results.get('battery_charging_status', 'Unknown')
-                    errors = results.get('errors', [])
-                    
-                    self.results_text.append(f"Battery Support: {'Yes' if battery_support else 'No'}")
-                    
-                    if battery_support:
-                        self.results_text.append(f"Initial State: {initial_charging} at {initial_level}%")
-                        self.results_text.append(f"Final State: {current_charging} at {current_level}%")
-                        self.results_text.append(f"Charging Events Detected: {len(charging_events)}")
-                        self.results_text.append(f"Battery Level Changes: {len(battery_changes)}")
-                        
-                        self.results_text.append("")
-                        self.results_text.append("CHARGING PORT:")
-                        self.results_text.append(f"  {charging_port_status}")
-                        
-                        self.results_text.append("")
-                        self.results_text.append("BATTERY CHARGING:")
-                        self.results_text.append(f"  {battery_charging_status}")
-                        
-                        if charging_events:
-                            self.results_text.append("")
-                            self.results_text.append("Charging Events:")
-                            for event in charging_events:
-                                timestamp = event['timestamp'].strftime('%H:%M:%S')
-                                action = event['event'].replace('_', ' ').title()
-                                level = event['battery_level']
-                                self.results_text.append(f"  {timestamp}: {action} at {level}%")
-                        
-                        if battery_changes:
-                            self.results_text.append("")
-                            self.results_text.append("Battery Level Changes:")
-                            for change in battery_changes[-5:]:  # Show last 5 changes
-                                timestamp = change['timestamp'].strftime('%H:%M:%S')
-                                old_level = change['old_level']
-                                new_level = change['new_level']
-                                change_amount = change['change']
-                                charging = 'charging' if change['charging'] else 'not charging'
-                                direction = '↑' if change_amount > 0 else '↓'
-                                self.results_text.append(f"  {timestamp}: {old_level}% {direction} {new_level}% ({charging})")
-                    
-                    if errors:
-                        self.results_text.append("")
-                        self.results_text.append(f"Errors encountered: {len(errors)}")
-                        for error in errors[:3]:
-                            self.results_text.append(f"  • {error}")
-                
-                elif 'Keyboard Test' in test_name:
-                    print(f"DEBUG: Processing keyboard test completion results")
-                    browser_opened = results.get('browser_opened', False)
-                    keyboard_test_url = results.get('keyboard_test_url', '')
-                    errors = results.get('errors', [])
-                    
-                    self.results_text.append(f"Browser Opened: {'Yes' if browser_opened else 'No'}")
-                    
-                    if browser_opened:
-                        self.results_text.append("✓ Keyboard test webpage opened successfully")
-                        self.results_text.append("✓ Interactive keyboard layout displayed")
-                        self.results_text.append("✓ Key press detection enabled")
-                        self.results_text.append("")
-                        self.results_text.append("KEYBOARD TEST FEATURES:")
-                        self.results_text.append("  • Visual keyboard layout with all keys")
-                        self.results_text.append("  • Real-time key press feedback (green highlight)")
-                        self.results_text.append("  • Progress tracking and statistics")
-                        self.results_text.append("  • Support for all standard keys including:")
-                        self.results_text.append("    - Function keys (F1-F12)")
-                        self.results_text.append("    - Number row and symbols")
-                        self.results_text.append("    - QWERTY letter keys")
-                        self.results_text.append("    - Special keys (Shift, Ctrl, Alt, Space, etc.)")
-                        self.results_text.append("")
-                        self.results_text.append("INSTRUCTIONS COMPLETED:")
-                        self.results_text.append("  ✓ Press keys to test them")
-                        self.results_text.append("  ✓ Watch for green highlighting")
-                        self.results_text.append("  ✓ Monitor progress percentage")
-                        self.results_text.append("  ✓ Aim for 80%+ completion")
-                        
-                        if keyboard_test_url:
-                            self.results_text.append("")
-                            self.results_text.append(f"Test URL: {keyboard_test_url}")
-                    else:
-                        self.results_text.append("⚠ Failed to open keyboard test webpage")
-                        self.results_text.append("Please manually open a browser and navigate to:")
-                        if keyboard_test_url:
-                            self.results_text.append(f"  {keyboard_test_url}")
-                    
-                    if errors:
-                        self.results_text.append("")
-                        self.results_text.append(f"Errors encountered: {len(errors)}")
-                        for error in errors[:3]:
-                            self.results_text.append(f"  • {error}")
+                self.results_text.append("\n".join(lines))
             
-            elif status == 'Error':
-                self.progress_bar.setVisible(False)
+            else:
                 error_msg = results.get('error', 'Unknown error')
                 self.results_text.append(f"\n{test_name} failed: {error_msg}")
-                print(f"DEBUG: Test error - {test_name}: {error_msg}")
-            
-            elif 'Testing' in status or 'Finding' in status:
-                self.results_text.append(f"{status}...")
+                log.debug("Test error - %s: %s", test_name, error_msg)
         
         except Exception as e:
             # Prevent any UI update errors from crashing the app
             print(f"Error updating test UI: {e}")
             import traceback
             traceback.print_exc()
+        finally:
+            self.results_text.setUpdatesEnabled(True)
 
 
 class LaptopTestingApp(QMainWindow):
@@ -1371,6 +2206,8 @@ class LaptopTestingApp(QMainWindow):
         self.hw_info = HardwareInfo()
         self.os_info = OSInfo()
         self.refresh_worker = None
+        self.report_worker = None
+        self.refresh_pending = False  # Auto-refresh skipped while hidden/minimized
         
         # Initialize update manager
         if UPDATE_MANAGER_AVAILABLE:
@@ -1391,9 +2228,9 @@ class LaptopTestingApp(QMainWindow):
         self.setGeometry(100, 100, 1200, 800)
         
         # Set window icon
-        icon_path = os.path.join(os.path.dirname(__file__), "icon.png")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        icon = app_icon()
+        if icon:
+            self.setWindowIcon(icon)
         
         # Center the window on screen
         self.center_window()
@@ -1426,23 +2263,7 @@ class LaptopTestingApp(QMainWindow):
         self.report_btn = QPushButton("📊 Generate Report")
         self.report_btn.setToolTip("Generate comprehensive CSV report of all system data")
         self.report_btn.clicked.connect(self.generate_csv_report)
-        self.report_btn.setStyleSheet("""
-            QPushButton {
-                font-size: 12px;
-                border: 1px solid #606060;
-                border-radius: 6px;
-                background-color: #4a4a4a;
-                color: white;
-                padding: 5px 10px;
-            }
-            QPushButton:hover {
-                background-color: #5a5a5a;
-                border: 1px solid #707070;
-            }
-            QPushButton:pressed {
-                background-color: #3a3a3a;
-            }
-        """)
+        self.report_btn.setStyleSheet(REPORT_BUTTON_STYLE)
         header_layout.addWidget(self.report_btn)
         
         # Refresh button with icon and tooltip
@@ -1450,23 +2271,7 @@ class LaptopTestingApp(QMainWindow):
         self.refresh_btn.setToolTip("Refresh Data")
         self.refresh_btn.clicked.connect(self.refresh_data)
         self.refresh_btn.setFixedSize(40, 30)  # Make it compact
-        self.refresh_btn.setStyleSheet("""
-            QPushButton {
-                font-size: 16px;
-                border: 1px solid #606060;
-                border-radius: 6px;
-                background-color: #4a4a4a;
-                color: white;
-                padding: 2px;
-            }
-            QPushButton:hover {
-                background-color: #5a5a5a;
-                border: 1px solid #707070;
-            }
-            QPushButton:pressed {
-                background-color: #3a3a3a;
-            }
-        """)
+        self.refresh_btn.setStyleSheet(ICON_BUTTON_STYLE)
         header_layout.addWidget(self.refresh_btn)
         
         # Update check button
@@ -1475,24 +2280,7 @@ class LaptopTestingApp(QMainWindow):
             self.update_btn.setToolTip("Check for Updates")
             self.update_btn.clicked.connect(self.check_for_updates_manual)
             self.update_btn.setFixedSize(40, 30)  # Make it compact
-            self.update_btn.setStyleSheet("""
-                QPushButton {
-                    font-size: 16px;
-                    border: 1px solid #606060;
-                    border-radius: 6px;
-                    background-color: #4a4a4a;
-                    color: #00ff00;
-                    padding: 2px;
-                }
-                QPushButton:hover {
-                    background-color: #5a5a5a;
-                    border: 1px solid #707070;
-                    color: #00ff88;
-                }
-                QPushButton:pressed {
-                    background-color: #3a3a3a;
-                }
-            """)
+            self.update_btn.setStyleSheet(UPDATE_BUTTON_STYLE)
             header_layout.addWidget(self.update_btn)
         
         layout.addLayout(header_layout)
@@ -1519,13 +2307,7 @@ class LaptopTestingApp(QMainWindow):
         
         # Status label (left side)
         self.status_label = QLabel("Ready")
-        self.status_label.setStyleSheet("""
-            QLabel {
-                color: #cccccc;
-                font-size: 11px;
-                padding: 5px;
-            }
-        """)
+        self.status_label.setStyleSheet(STATUS_LABEL_STYLE)
         status_layout.addWidget(self.status_label)
         
         # Add stretch to push credits to the right
@@ -1535,52 +2317,20 @@ class LaptopTestingApp(QMainWindow):
         self.contributor_label = QLabel("Contributor")
         self.contributor_label.setToolTip("Visit GitHub repository: https://github.com/bibekchandsah/pc-checker")
         self.contributor_label.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self.contributor_label.setStyleSheet("""
-            QLabel {
-                color: #32CD32;
-                font-size: 13px;
-                text-decoration: underline;
-                padding: 5px 10px;
-                font-weight: bold;
-            }
-            QLabel:hover {
-                color: #aaaaaa;
-                background-color: rgba(255, 255, 255, 0.1);
-                border-radius: 3px;
-            }
-        """)
+        self.contributor_label.setStyleSheet(CONTRIBUTOR_LABEL_STYLE)
         self.contributor_label.mousePressEvent = self.open_contributor_github
         status_layout.addWidget(self.contributor_label)
         
         # Separator between contributor and developer
         separator_label = QLabel(" | ")
-        separator_label.setStyleSheet("""
-            QLabel {
-                color: #666666;
-                font-size: 13px;
-                padding: 5px 2px;
-            }
-        """)
+        separator_label.setStyleSheet(SEPARATOR_LABEL_STYLE)
         status_layout.addWidget(separator_label)
         
         # Developer credit label (right side)
         self.developer_label = QLabel("Developed by Bibek")
         self.developer_label.setToolTip("Visit developer's website: https://www.bibekchandsah.com.np/")
         self.developer_label.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self.developer_label.setStyleSheet("""
-            QLabel {
-                color: royalblue;
-                font-size: 13px;
-                text-decoration: underline;
-                padding: 5px 10px;
-                font-weight: bold;
-            }
-            QLabel:hover {
-                color: #aaaaaa;
-                background-color: rgba(255, 255, 255, 0.1);
-                border-radius: 3px;
-            }
-        """)
+        self.developer_label.setStyleSheet(DEVELOPER_LABEL_STYLE)
         self.developer_label.mousePressEvent = self.open_developer_website
         status_layout.addWidget(self.developer_label)
         
@@ -1592,15 +2342,39 @@ class LaptopTestingApp(QMainWindow):
     def setup_refresh_timer(self):
         """Setup auto-refresh timer"""
         self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self.refresh_data)
+        self.refresh_timer.timeout.connect(self.on_refresh_timer)
         self.refresh_timer.start(30000)  # 30 seconds
     
+    def on_refresh_timer(self):
+        """Auto-refresh tick, deferred while the window can't be seen"""
+        if self.isVisible() and not self.isMinimized():
+            self.refresh_data()
+        else:
+            self.refresh_pending = True
+    
+    def resync_refresh(self):
+        """Run an auto-refresh that was skipped while the window was hidden"""
+        if self.refresh_pending and self.auto_refresh_cb.isChecked():
+            self.refresh_pending = False
+            self.refresh_data()
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.resync_refresh()
+    
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        # Restoring from the taskbar doesn't always deliver a showEvent
+        if event.type() == QEvent.WindowStateChange and not self.isMinimized():
+            self.resync_refresh()
+    
     def toggle_auto_refresh(self, enabled):
         """Toggle auto-refresh"""
         if enabled:
             self.refresh_timer.start(30000)
         else:
             self.refresh_timer.stop()
+            self.refresh_pending = False
     
     def load_initial_data(self):
         """Load initial data"""
@@ -1625,10 +2399,11 @@ class LaptopTestingApp(QMainWindow):
             if 'error' in data:
                 self.status_label.setText(f"Error: {data['error']}")
             else:
-                # Update all tabs
-                self.system_tab.update_data(data)
-                self.hardware_tab.update_data(data)
-                self.os_tab.update_data(data)
+                # Resolve the shared sections once and hand them to every tab
+                view = build_view(data)
+                self.system_tab.update_data(view)
+                self.hardware_tab.update_data(view)
+                self.os_tab.update_data(view)
                 
                 self.status_label.setText(f"Last updated: {data.get('timestamp', 'Unknown')}")
         except Exception as e:
@@ -1638,489 +2413,43 @@ class LaptopTestingApp(QMainWindow):
     
     def generate_csv_report(self):
         """Generate comprehensive CSV report of all system data"""
-        try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"system_report_{timestamp}.csv"
-            
-            # Collect all data with error handling
-            hw_data = self.hw_info.get_all_info()
-            
-            # Use a safer OS data collection to avoid WMI timeouts
-            try:
-                os_data = {
-                    'os_details': self.os_info.get_os_details(),
-                    'installed_software': self.os_info.get_installed_software(),
-                    'network_configuration': self.os_info.get_network_configuration(),
-                    # Skip the problematic WMI calls that cause timeouts
-                    'system_services': [{'name': 'WMI Query Skipped', 'status': 'Timeout Protection'}],
-                    'system_drivers': [{'name': 'WMI Query Skipped', 'status': 'Timeout Protection'}],
-                    'startup_programs': [],
-                    'users_and_groups': {'status': 'WMI Query Skipped - Timeout Protection'}
-                }
-            except Exception as e:
-                print(f"Warning: Error collecting OS data, using minimal data: {e}")
-                os_data = {
-                    'os_details': {'system': 'Unknown', 'error': str(e)},
-                    'installed_software': [],
-                    'network_configuration': {'error': str(e)},
-                    'system_services': [{'error': str(e)}],
-                    'system_drivers': [{'error': str(e)}],
-                    'startup_programs': [],
-                    'users_and_groups': {'error': str(e)}
-                }
-            
-            # Get test results if available
-            test_results = {}
-            if hasattr(self.tests_tab, 'current_test_results') and self.tests_tab.current_test_results:
-                test_results = self.tests_tab.current_test_results
-            
-            # Prepare CSV data
-            csv_data = []
-            
-            # System Overview Section - Enhanced with card details
-            system_info = hw_data.get('system', {})
-            csv_data.append(['SYSTEM OVERVIEW', '', ''])
-            csv_data.append(['Component', 'Property', 'Value'])
-            
-            # System Summary Card
-            csv_data.append(['=== SYSTEM SUMMARY CARD ===', '', ''])
-            csv_data.append(['System Summary', 'Hostname', system_info.get('hostname', 'Unknown')])
-            csv_data.append(['System Summary', 'Operating System', f"{system_info.get('system', 'Unknown')} {system_info.get('release', '')}".strip()])
-            csv_data.append(['System Summary', 'Processor', system_info.get('processor', 'Unknown')])
-            csv_data.append(['System Summary', 'Vendor', hw_data.get('cpu', {}).get('vendor', 'Unknown')])
-            
-            # Memory info for summary card
-            memory_info = hw_data.get('memory', {})
-            total_memory = memory_info.get('total', 0)
-            available_memory = memory_info.get('available', 0)
-            csv_data.append(['System Summary', 'Memory', f"{available_memory:.2f} / {total_memory:.2f} GB"])
-            
-            csv_data.append(['System Summary', 'Boot Time', system_info.get('boot_time', 'Unknown')])
-            csv_data.append(['System Summary', 'Uptime', system_info.get('uptime', 'Unknown')])
-            csv_data.append(['System Summary', 'MAC Address', system_info.get('mac_address', 'Unknown')])
-            
-            # Computer manufacturer info
-            csv_data.append(['System Summary', 'Computer Manufacturer', system_info.get('computer_manufacturer', 'Unknown')])
-            csv_data.append(['System Summary', 'Computer Model', system_info.get('computer_model', 'Unknown')])
-            
-            csv_data.append(['', '', ''])
-            
-            # System Information Card
-            csv_data.append(['=== SYSTEM INFORMATION CARD ===', '', ''])
-            csv_data.append(['System Information', 'Hostname', system_info.get('hostname', 'Unknown')])
-            csv_data.append(['System Information', 'System', system_info.get('system', 'Unknown')])
-            csv_data.append(['System Information', 'Release', system_info.get('release', 'Unknown')])
-            csv_data.append(['System Information', 'Version', system_info.get('version', 'Unknown')])
-            csv_data.append(['System Information', 'Machine', system_info.get('machine', 'Unknown')])
-            csv_data.append(['System Information', 'Processor', system_info.get('processor', 'Unknown')])
-            csv_data.append(['System Information', 'Architecture', str(system_info.get('architecture', 'Unknown'))])
-            csv_data.append(['System Information', 'Boot Time', system_info.get('boot_time', 'Unknown')])
-            csv_data.append(['System Information', 'Uptime', system_info.get('uptime', 'Unknown')])
-            csv_data.append(['System Information', 'MAC Address', system_info.get('mac_address', 'Unknown')])
-            
-            csv_data.append(['', '', ''])
-            
-            # BIOS & Motherboard Card
-            csv_data.append(['=== BIOS & MOTHERBOARD CARD ===', '', ''])
-            csv_data.append(['BIOS & Motherboard', 'BIOS Version', system_info.get('bios_version', 'Unknown')])
-            csv_data.append(['BIOS & Motherboard', 'BIOS Manufacturer', system_info.get('bios_manufacturer', 'Unknown')])
-            csv_data.append(['BIOS & Motherboard', 'BIOS Serial', system_info.get('bios_serial', 'Unknown')])
-            csv_data.append(['BIOS & Motherboard', 'BIOS Date', system_info.get('bios_date', 'Unknown')])
-            csv_data.append(['BIOS & Motherboard', 'Motherboard Manufacturer', system_info.get('motherboard_manufacturer', 'Unknown')])
-            csv_data.append(['BIOS & Motherboard', 'Motherboard Product', system_info.get('motherboard_product', 'Unknown')])
-            csv_data.append(['BIOS & Motherboard', 'Motherboard Serial', system_info.get('motherboard_serial', 'Unknown')])
-            csv_data.append(['BIOS & Motherboard', 'Computer Manufacturer', system_info.get('computer_manufacturer', 'Unknown')])
-            csv_data.append(['BIOS & Motherboard', 'Computer Model', system_info.get('computer_model', 'Unknown')])
-            
-            # Graphics cards info for BIOS card
-            gpu_list = hw_data.get('gpu', [])
-            if isinstance(gpu_list, list) and gpu_list:
-                gpu_names = [gpu.get('name', 'Unknown') for gpu in gpu_list if isinstance(gpu, dict)]
-                if gpu_names:
-                    if any('dedicated' in name.lower() or 'nvidia' in name.lower() or 'amd' in name.lower() or 'radeon' in name.lower() for name in gpu_names):
-                        dedicated_gpus = [name for name in gpu_names if 'intel' not in name.lower()]
-                        if dedicated_gpus:
-                            csv_data.append(['BIOS & Motherboard', 'Graphics Cards', ', '.join(dedicated_gpus)])
-                        else:
-                            csv_data.append(['BIOS & Motherboard', 'Graphics Cards', 'NO DEDICATED GPU FOUND (INTEGRATED)'])
-                    else:
-                        csv_data.append(['BIOS & Motherboard', 'Graphics Cards', 'NO DEDICATED GPU FOUND (INTEGRATED)'])
-                else:
-                    csv_data.append(['BIOS & Motherboard', 'Graphics Cards', 'Unknown'])
-            else:
-                csv_data.append(['BIOS & Motherboard', 'Graphics Cards', 'Unknown'])
-            
-            csv_data.append(['', '', ''])
-            
-            # CPU Information Card
-            csv_data.append(['=== CPU INFORMATION CARD ===', '', ''])
-            cpu_info = hw_data.get('cpu', {})
-            csv_data.append(['CPU Information', 'Name', cpu_info.get('name', 'Unknown')])
-            csv_data.append(['CPU Information', 'Architecture', cpu_info.get('architecture', 'Unknown')])
-            csv_data.append(['CPU Information', 'Physical Cores', str(cpu_info.get('cores_physical', 'Unknown'))])
-            csv_data.append(['CPU Information', 'Logical Cores', str(cpu_info.get('cores_logical', 'Unknown'))])
-            csv_data.append(['CPU Information', 'Vendor', cpu_info.get('vendor', 'Unknown')])
-            csv_data.append(['CPU Information', 'Temperature', cpu_info.get('temperature', 'Not available')])
-            csv_data.append(['CPU Information', 'Max Frequency MHz', str(cpu_info.get('frequency_max', 'Unknown'))])
-            csv_data.append(['CPU Information', 'Current Frequency MHz', str(cpu_info.get('frequency_current', 'Unknown'))])
-            csv_data.append(['CPU Information', 'Usage Percent', str(cpu_info.get('usage_percent', 'Unknown'))])
-            csv_data.append(['CPU Information', 'Cache L1', cpu_info.get('cache_l1', 'Unknown')])
-            csv_data.append(['CPU Information', 'Cache L2', cpu_info.get('cache_l2', 'Unknown')])
-            csv_data.append(['CPU Information', 'Cache L3', cpu_info.get('cache_l3', 'Unknown')])
-            
-            csv_data.append(['', '', ''])
-            
-            # RAM Information Card
-            csv_data.append(['=== RAM INFORMATION CARD ===', '', ''])
-            memory_info = hw_data.get('memory', {})
-            csv_data.append(['RAM Information', 'Total', f"{memory_info.get('total', 'Unknown')} GB"])
-            csv_data.append(['RAM Information', 'Available', f"{memory_info.get('available', 'Unknown')} GB"])
-            csv_data.append(['RAM Information', 'Used', f"{memory_info.get('used', 'Unknown')} GB"])
-            csv_data.append(['RAM Information', 'Percentage', f"{memory_info.get('percentage', 'Unknown')}%"])
-            csv_data.append(['RAM Information', 'Swap Total', f"{memory_info.get('swap_total', 'Unknown')} GB"])
-            csv_data.append(['RAM Information', 'Swap Used', f"{memory_info.get('swap_used', 'Unknown')} GB"])
-            csv_data.append(['RAM Information', 'Swap Free', f"{memory_info.get('swap_free', 'Unknown')} GB"])
-            csv_data.append(['RAM Information', 'Swap Percentage', f"{memory_info.get('swap_percentage', 'Unknown')}%"])
-            
-            # Memory slots information
-            memory_slots = memory_info.get('memory_slots', [])
-            if isinstance(memory_slots, list) and memory_slots:
-                csv_data.append(['RAM Information', 'Memory Slots', str(len(memory_slots))])
-                for i, slot in enumerate(memory_slots):
-                    if isinstance(slot, dict):
-                        size = slot.get('size', 'Unknown')
-                        speed = slot.get('speed', 'Unknown')
-                        manufacturer = slot.get('manufacturer', 'Unknown')
-                        csv_data.append(['RAM Information', f'Slot {i+1}', f"{size} {speed} {manufacturer}"])
-            else:
-                csv_data.append(['RAM Information', 'Memory Slots', '2'])  # Default from screenshot
-                csv_data.append(['RAM Information', 'Slot 1', '8GB 3200MHZ SAMSUNG'])
-                csv_data.append(['RAM Information', 'Slot 2', '8GB 3200MHZ SAMSUNG'])
-            
-            csv_data.append(['', '', ''])
-            
-            # ROM Information Card (Storage)
-            csv_data.append(['=== ROM INFORMATION CARD ===', '', ''])
-            disk_info = hw_data.get('disk', {})
-            partitions = disk_info.get('partitions', [])
-            physical_disks = disk_info.get('physical_disks', [])
-            
-            csv_data.append(['ROM Information', 'Partitions', str(len(partitions)) if partitions else 'Unknown'])
-            
-            # Add partition details
-            partition_count = 0
-            for partition in partitions:
-                if isinstance(partition, dict) and partition.get('device', '').endswith('\\'):
-                    partition_count += 1
-                    drive_letter = partition.get('device', 'Unknown')
-                    fstype = partition.get('fstype', 'Unknown')
-                    total_gb = partition.get('total', 0)
-                    used_gb = partition.get('used', 0)
-                    usage_percent = (used_gb / total_gb * 100) if total_gb > 0 else 0
-                    
-                    csv_data.append(['ROM Information', f'Drive {drive_letter}', f"{fstype} - {total_gb:.1f}GB/ {total_gb:.1f}GB ({usage_percent:.1f}% USED)"])
-            
-            # Add physical disk details
-            if physical_disks:
-                for i, disk in enumerate(physical_disks):
-                    if isinstance(disk, dict):
-                        model = disk.get('model', 'Unknown')
-                        serial = disk.get('serial', 'Unknown')
-                        disk_type = disk.get('type', 'Unknown')
-                        size = disk.get('size', 'Unknown')
-                        status = disk.get('status', 'Unknown')
-                        
-                        csv_data.append(['ROM Information', f'Disk {i+1} Model', model])
-                        csv_data.append(['ROM Information', f'Disk {i+1} Serial', serial])
-                        csv_data.append(['ROM Information', f'Disk {i+1} Type', disk_type])
-                        csv_data.append(['ROM Information', f'Disk {i+1} Size', f"{size}GB" if isinstance(size, (int, float)) else str(size)])
-                        csv_data.append(['ROM Information', f'Disk {i+1} Status', status])
-            
-            csv_data.append(['', '', ''])
-            
-            # Battery Information Card
-            csv_data.append(['=== BATTERY INFORMATION CARD ===', '', ''])
-            battery_info = hw_data.get('battery', {})
-            if isinstance(battery_info, dict) and battery_info:
-                csv_data.append(['Battery Information', 'Present', 'Yes (Laptop)' if battery_info.get('percent', 'Unknown') != 'Unknown' else 'No'])
-                csv_data.append(['Battery Information', 'Charge Percent', f"{battery_info.get('percent', 'Unknown')}%"])
-                csv_data.append(['Battery Information', 'Status', 'Fully Charged' if battery_info.get('percent', 0) == 100 else f"Charging: {battery_info.get('power_plugged', 'Unknown')}"])
-                csv_data.append(['Battery Information', 'Time Left', battery_info.get('time_left', 'Unknown')])
-                csv_data.append(['Battery Information', 'Cycle Count', battery_info.get('cycle_count', 'Not Available')])
-                csv_data.append(['Battery Information', 'Chemistry', battery_info.get('chemistry', 'Unknown')])
-                csv_data.append(['Battery Information', 'Design Voltage', str(battery_info.get('design_voltage', 'Unknown'))])
-                csv_data.append(['Battery Information', 'Charge Remaining', str(battery_info.get('charge_remaining', 'Unknown'))])
-            else:
-                csv_data.append(['Battery Information', 'Present', 'Yes (Laptop)'])
-                csv_data.append(['Battery Information', 'Charge Percent', '100.0%'])
-                csv_data.append(['Battery Information', 'Status', 'Fully Charged'])
-                csv_data.append(['Battery Information', 'Time Left', 'Unlimited (Charging)'])
-                csv_data.append(['Battery Information', 'Cycle Count', 'Not Available'])
-            
-            csv_data.append(['', '', ''])
-            
-            # Other Information Card
-            csv_data.append(['=== OTHER INFORMATION CARD ===', '', ''])
-            other_info = hw_data.get('other', {})
-            
-            # Temperature sensors
-            temperatures = other_info.get('temperatures', {})
-            if isinstance(temperatures, dict) and temperatures:
-                csv_data.append(['Other Information', 'Sensors (Temp)', f"{len(temperatures)} sensors found"])
-                for sensor_name, temp_list in temperatures.items():
-                    if temp_list:
-                        csv_data.append(['Other Information', f'Temp {sensor_name}', f"{temp_list[0]:.1f}°C"])
-            else:
-                csv_data.append(['Other Information', 'Sensors (Temp)', 'Not Available'])
-            
-            # Fan speeds
-            fan_speeds = other_info.get('fan_speeds', {})
-            if isinstance(fan_speeds, dict) and fan_speeds:
-                csv_data.append(['Other Information', 'Fan Speeds', f"{len(fan_speeds)} fans found"])
-                for fan_name, speed in fan_speeds.items():
-                    csv_data.append(['Other Information', f'Fan {fan_name}', f"{speed} RPM"])
-            else:
-                csv_data.append(['Other Information', 'Fan Speeds', 'Not Available'])
-            
-            # Camera information
-            cameras = other_info.get('cameras', [])
-            if isinstance(cameras, list) and cameras:
-                csv_data.append(['Other Information', 'Camera(s)', f"{len(cameras)} cameras detected"])
-                for i, camera in enumerate(cameras):
-                    csv_data.append(['Other Information', f'Camera {i+1}', str(camera)])
-            else:
-                csv_data.append(['Other Information', 'Camera(s)', '2 cameras detected'])
-            
-            # TPM Information
-            tpm_info = other_info.get('tpm', {})
-            if isinstance(tpm_info, dict) and tpm_info:
-                csv_data.append(['Other Information', 'TPM', tpm_info.get('present', 'Not Available')])
-            else:
-                csv_data.append(['Other Information', 'TPM', 'Not Available'])
-            
-            # Chassis Type
-            chassis_type = other_info.get('chassis_type', 'Unknown')
-            csv_data.append(['Other Information', 'Chassis Type', chassis_type if chassis_type != 'Unknown' else 'Convertible'])
-            
-            # Secure Boot
-            secure_boot = other_info.get('secure_boot', 'Unknown')
-            csv_data.append(['Other Information', 'Secure Boot', secure_boot if secure_boot != 'Unknown' else 'Legacy BIOS'])
-            
-            csv_data.append(['', '', ''])
-            
-            # Hardware Details Section
-            csv_data.append(['HARDWARE DETAILS', '', ''])
-            csv_data.append(['Component', 'Property', 'Value'])
-            
-            # CPU Information
-            cpu_info = hw_data.get('cpu', {})
-            csv_data.append(['CPU', 'Name', cpu_info.get('name', 'Unknown')])
-            csv_data.append(['CPU', 'Cores Physical', str(cpu_info.get('cores_physical', 'Unknown'))])
-            csv_data.append(['CPU', 'Cores Logical', str(cpu_info.get('cores_logical', 'Unknown'))])
-            csv_data.append(['CPU', 'Max Frequency MHz', str(cpu_info.get('frequency_max', 'Unknown'))])
-            csv_data.append(['CPU', 'Current Frequency MHz', str(cpu_info.get('frequency_current', 'Unknown'))])
-            csv_data.append(['CPU', 'Usage Percent', str(cpu_info.get('usage_percent', 'Unknown'))])
-            csv_data.append(['CPU', 'Temperature C', str(cpu_info.get('temperature', 'Unknown'))])
-            
-            # Memory Information
-            memory_info = hw_data.get('memory', {})
-            csv_data.append(['Memory', 'Total GB', str(memory_info.get('total', 'Unknown'))])
-            csv_data.append(['Memory', 'Available GB', str(memory_info.get('available', 'Unknown'))])
-            csv_data.append(['Memory', 'Used GB', str(memory_info.get('used', 'Unknown'))])
-            csv_data.append(['Memory', 'Usage Percent', str(memory_info.get('percentage', 'Unknown'))])
-            
-            # Storage Information
-            disk_info = hw_data.get('disk', {})
-            partitions = disk_info.get('partitions', [])
-            for i, partition in enumerate(partitions):
-                if isinstance(partition, dict):
-                    csv_data.append([f'Storage {i+1}', 'Device', partition.get('device', 'Unknown')])
-                    csv_data.append([f'Storage {i+1}', 'Mountpoint', partition.get('mountpoint', 'Unknown')])
-                    csv_data.append([f'Storage {i+1}', 'File System', partition.get('fstype', 'Unknown')])
-                    csv_data.append([f'Storage {i+1}', 'Total GB', str(partition.get('total', 'Unknown'))])
-                    csv_data.append([f'Storage {i+1}', 'Used GB', str(partition.get('used', 'Unknown'))])
-                    csv_data.append([f'Storage {i+1}', 'Free GB', str(partition.get('free', 'Unknown'))])
-                    csv_data.append([f'Storage {i+1}', 'Usage Percent', str(partition.get('percent', 'Unknown'))])
-            
-            # GPU Information - Fixed: gpu_info is a list, not a dict
-            gpu_list = hw_data.get('gpu', [])
-            if isinstance(gpu_list, list) and gpu_list:
-                for i, gpu in enumerate(gpu_list):
-                    if isinstance(gpu, dict):
-                        csv_data.append([f'GPU {i+1}', 'Name', gpu.get('name', 'Unknown')])
-                        csv_data.append([f'GPU {i+1}', 'Driver Version', gpu.get('driver_version', 'Unknown')])
-                        csv_data.append([f'GPU {i+1}', 'Adapter RAM', str(gpu.get('adapter_ram', 'Unknown'))])
-                        csv_data.append([f'GPU {i+1}', 'Video Processor', gpu.get('video_processor', 'Unknown')])
-                        csv_data.append([f'GPU {i+1}', 'Status', gpu.get('status', 'Unknown')])
-            
-            # Network Information - Fixed: access interfaces correctly
-            network_info = hw_data.get('network', {})
-            interfaces = network_info.get('interfaces', [])
-            if isinstance(interfaces, list):
-                for i, interface in enumerate(interfaces):
-                    if isinstance(interface, dict):
-                        csv_data.append([f'Network {i+1}', 'Interface', interface.get('name', 'Unknown')])
-                        addresses = interface.get('addresses', [])
-                        if isinstance(addresses, list):
-                            # Extract IP addresses from the address dictionaries
-                            ip_addresses = []
-                            for addr in addresses:
-                                if isinstance(addr, dict) and 'address' in addr:
-                                    # Only include IPv4 addresses (family '2'), skip MAC addresses (family '-1')
-                                    if addr.get('family') == '2':
-                                        ip_addresses.append(addr['address'])
-                            csv_data.append([f'Network {i+1}', 'IP Address', ', '.join(ip_addresses) if ip_addresses else 'No IP Address'])
-                        else:
-                            csv_data.append([f'Network {i+1}', 'IP Address', str(addresses)])
-                        csv_data.append([f'Network {i+1}', 'Status', 'Up' if interface.get('is_up', False) else 'Down'])
-                        csv_data.append([f'Network {i+1}', 'Speed', str(interface.get('speed', 'Unknown'))])
-                        
-                        # Get I/O statistics if available
-                        io_stats = interface.get('io', {})
-                        if isinstance(io_stats, dict):
-                            csv_data.append([f'Network {i+1}', 'Bytes Sent', str(io_stats.get('bytes_sent', 'Unknown'))])
-                            csv_data.append([f'Network {i+1}', 'Bytes Received', str(io_stats.get('bytes_recv', 'Unknown'))])
-            
-            # Battery Information
-            battery_info = hw_data.get('battery', {})
-            if isinstance(battery_info, dict) and battery_info:
-                csv_data.append(['Battery', 'Present', str(battery_info.get('percent', 'Unknown') != 'Unknown')])
-                csv_data.append(['Battery', 'Percent', str(battery_info.get('percent', 'Unknown'))])
-                csv_data.append(['Battery', 'Power Plugged', str(battery_info.get('power_plugged', 'Unknown'))])
-                csv_data.append(['Battery', 'Time Left', str(battery_info.get('time_left', 'Unknown'))])
-                csv_data.append(['Battery', 'Chemistry', str(battery_info.get('chemistry', 'Unknown'))])
-            
-            csv_data.append(['', '', ''])
-            
-            # OS Details Section
-            csv_data.append(['OS DETAILS', '', ''])
-            csv_data.append(['Component', 'Property', 'Value'])
-            
-            os_details = os_data.get('os_details', {})
-            if isinstance(os_details, dict):
-                csv_data.append(['OS', 'System', os_details.get('system', 'Unknown')])
-                csv_data.append(['OS', 'Release', os_details.get('release', 'Unknown')])
-                csv_data.append(['OS', 'Version', os_details.get('version', 'Unknown')])
-                csv_data.append(['OS', 'Machine', os_details.get('machine', 'Unknown')])
-                csv_data.append(['OS', 'Processor', os_details.get('processor', 'Unknown')])
-                csv_data.append(['OS', 'Architecture', str(os_details.get('architecture', 'Unknown'))])
-                csv_data.append(['OS', 'Platform', os_details.get('platform', 'Unknown')])
-                csv_data.append(['OS', 'Node', os_details.get('node', 'Unknown')])
-                csv_data.append(['OS', 'Boot Time', os_details.get('boot_time', 'Unknown')])
-                csv_data.append(['OS', 'Uptime', os_details.get('uptime', 'Unknown')])
-            
-            # Network Configuration - Handle error case
-            network_config = os_data.get('network_configuration', {})
-            if isinstance(network_config, dict) and 'error' not in network_config:
-                adapters = network_config.get('adapters', [])
-                if isinstance(adapters, list):
-                    for i, adapter in enumerate(adapters):
-                        if isinstance(adapter, dict):
-                            csv_data.append([f'Network Adapter {i+1}', 'Name', adapter.get('name', 'Unknown')])
-                            csv_data.append([f'Network Adapter {i+1}', 'Description', adapter.get('description', 'Unknown')])
-                            csv_data.append([f'Network Adapter {i+1}', 'MAC Address', adapter.get('mac_address', 'Unknown')])
-                            csv_data.append([f'Network Adapter {i+1}', 'Status', adapter.get('status', 'Unknown')])
-                            ip_addresses = adapter.get('ip_addresses', [])
-                            if isinstance(ip_addresses, list):
-                                csv_data.append([f'Network Adapter {i+1}', 'IP Addresses', ', '.join(ip_addresses)])
-                            else:
-                                csv_data.append([f'Network Adapter {i+1}', 'IP Addresses', str(ip_addresses)])
-            else:
-                csv_data.append(['Network Configuration', 'Status', 'Error retrieving network configuration'])
-            
-            # Installed Software (all items) - Handle list correctly
-            installed_software = os_data.get('installed_software', [])
-            csv_data.append(['', '', ''])
-            csv_data.append(['INSTALLED SOFTWARE (All)', '', ''])
-            csv_data.append(['Software', 'Name', 'Version'])
-            if isinstance(installed_software, list):
-                for i, software in enumerate(installed_software):
-                    if isinstance(software, dict):
-                        name = software.get('name', 'Unknown')
-                        version = software.get('version', 'Unknown')
-                        csv_data.append([f'Software {i+1}', name, version])
-            
-            
-            # System Services (first 10 items) - Handle list correctly
-            system_services = os_data.get('system_services', [])
-            csv_data.append(['', '', ''])
-            csv_data.append(['SYSTEM SERVICES (Top 10)', '', ''])
-            csv_data.append(['Service', 'Name', 'Status'])
-            if isinstance(system_services, list):
-                valid_services = [s for s in system_services if isinstance(s, dict) and 'error' not in s]
-                for i, service in enumerate(valid_services[:10]):
-                    name = service.get('name', 'Unknown')
-                    status = service.get('status', 'Unknown')
-                    csv_data.append([f'Service {i+1}', name, status])
-                if not valid_services:
-                    csv_data.append(['Services', 'Status', 'No services retrieved (WMI access required)'])
-            
-            csv_data.append(['', '', ''])
-            
-            # System Tests Section
-            csv_data.append(['SYSTEM TESTS', '', ''])
-            csv_data.append(['Test', 'Property', 'Value'])
-            
-            if test_results and isinstance(test_results, dict):
-                test_name = test_results.get('test_name', 'Unknown Test')
-                status = test_results.get('status', 'Unknown')
-                progress = test_results.get('progress', 0)
-                start_time = test_results.get('start_time', 'Unknown')
-                
-                csv_data.append(['Latest Test', 'Name', test_name])
-                csv_data.append(['Latest Test', 'Status', status])
-                csv_data.append(['Latest Test', 'Progress', f"{progress}%"])
-                csv_data.append(['Latest Test', 'Start Time', str(start_time)])
-                
-                # Add specific test results
-                for key in ['avg_usage', 'max_usage', 'score', 'duration', 'read_speed_mbps', 'write_speed_mbps', 'download_mbps', 'upload_mbps', 'ping_ms']:
-                    if key in test_results:
-                        value = test_results[key]
-                        if key.endswith('_mbps'):
-                            csv_data.append(['Latest Test', key.replace('_', ' ').title(), f"{value} MB/s"])
-                        elif key == 'ping_ms':
-                            csv_data.append(['Latest Test', 'Ping', f"{value} ms"])
-                        elif key in ['avg_usage', 'max_usage']:
-                            csv_data.append(['Latest Test', key.replace('_', ' ').title(), f"{value}%"])
-                        elif key == 'duration':
-                            csv_data.append(['Latest Test', 'Duration', f"{value}s"])
-                        else:
-                            csv_data.append(['Latest Test', key.replace('_', ' ').title(), str(value)])
-                    
-                errors = test_results.get('errors', [])
-                if errors and isinstance(errors, list):
-                    csv_data.append(['Latest Test', 'Errors', f"{len(errors)} errors found"])
-                    for i, error in enumerate(errors[:3]):  # First 3 errors
-                        csv_data.append(['Latest Test', f'Error {i+1}', str(error)])
-            else:
-                csv_data.append(['Latest Test', 'Status', 'No test results available'])
-            
-            # Write CSV file
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                for row in csv_data:
-                    writer.writerow(row)
-            
-            # Show success message
-            QMessageBox.information(
-                self, 
-                "Report Generated", 
-                f"System report has been generated successfully!\n\nFile: {filename}\nLocation: {os.path.abspath(filename)}\n\nThe report contains:\n• System Overview\n• Hardware Details\n• OS Details\n• System Tests Results"
-            )
-            
-            self.status_label.setText(f"CSV report generated: {filename}")
-            
-        except Exception as e:
-            QMessageBox.critical(
-                self, 
-                "Error", 
-                f"Failed to generate report:\n{str(e)}\n\nPlease check the console for detailed error information."
-            )
-            self.status_label.setText(f"Error generating report: {str(e)}")
-            # Print detailed error to console for debugging
-            import traceback
-            print(f"CSV Generation Error: {str(e)}")
-            traceback.print_exc()
+        if self.report_worker and self.report_worker.isRunning():
+            return
+        
+        # Get test results if available
+        test_results = {}
+        if hasattr(self.tests_tab, 'current_test_results') and self.tests_tab.current_test_results:
+            test_results = self.tests_tab.current_test_results
+        
+        self.report_btn.setEnabled(False)
+        self.status_label.setText("Generating CSV report...")
+        
+        self.report_worker = ReportWorker(self.hw_info, self.os_info, test_results)
+        self.report_worker.report_ready.connect(self.on_report_ready)
+        self.report_worker.report_failed.connect(self.on_report_failed)
+        self.report_worker.start()
+    
+    def on_report_ready(self, filename):
+        """Tell the user where the report was written"""
+        # Show success message
+        QMessageBox.information(
+            self, 
+            "Report Generated", 
+            f"System report has been generated successfully!\n\nFile: {filename}\nLocation: {os.path.abspath(filename)}\n\nThe report contains:\n• System Overview\n• Hardware Details\n• OS Details\n• System Tests Results"
+        )
+        
+        self.status_label.setText(f"CSV report generated: {filename}")
+        self.report_btn.setEnabled(True)
+    
+    def on_report_failed(self, error):
+        """Report a failed CSV generation to the user"""
+        QMessageBox.critical(
+            self, 
+            "Error", 
+            f"Failed to generate report:\n{error}\n\nPlease check the console for detailed error information."
+        )
+        self.status_label.setText(f"Error generating report: {error}")
+        self.report_btn.setEnabled(True)
     
     def open_developer_website(self, event):
         """Open developer website when the label is clicked"""
@@ -2168,9 +2497,9 @@ class LaptopTestingApp(QMainWindow):
             msg.setText("Update feature is not available.\n\nPlease install required packages:\n• requests\n• packaging\n\nOr check for updates manually at:\nhttps://github.com/bibekchandsah/pc-checker")
             
             # Set window icon if available
-            icon_path = os.path.join(os.path.dirname(__file__), "icon.png")
-            if os.path.exists(icon_path):
-                msg.setWindowIcon(QIcon(icon_path))
+            icon = app_icon()
+            if icon:
+                msg.setWindowIcon(icon)
             
             msg.exec()
     
@@ -2184,6 +2513,31 @@ class LaptopTestingApp(QMainWindow):
         self.move(window_geometry.topLeft())
 
 
+def acquire_instance_mutex():
+    """Create the Windows single-instance mutex, or return None if another instance owns it"""
+    import ctypes
+    ERROR_ALREADY_EXISTS = 183
+    
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    handle = kernel32.CreateMutexW(None, True, "Local\\LaptopTestingProgram")
+    if handle and ctypes.get_last_error() == ERROR_ALREADY_EXISTS:
+        kernel32.CloseHandle(handle)
+        return None
+    # Hold the handle for the process lifetime; Windows releases it on exit
+    return handle
+
+
+def show_already_running_message():
+    """Tell the user another instance is already open"""
+    msg = QMessageBox()
+    msg.setIcon(QMessageBox.Warning)
+    msg.setWindowTitle("Already Running")
+    msg.setText("Laptop Testing Program is already running!")
+    msg.setInformativeText("Please check your taskbar or close the existing instance before starting a new one.")
+    msg.setStandardButtons(QMessageBox.Ok)
+    msg.exec()
+
+
 def main():
     """Main function"""
     app = QApplication(sys.argv)
@@ -2194,72 +2548,46 @@ def main():
     app.setQuitOnLastWindowClosed(True)
     
     # Check if another instance is already running
-    import tempfile
-    import os
-    lock_file = os.path.join(tempfile.gettempdir(), 'laptop_testing_program.lock')
+    lock_file = None
     
     try:
-        # Check if lock file exists and if the process is still running
-        if os.path.exists(lock_file):
-            try:
-                # Read the PID from the lock file
-                with open(lock_file, 'r') as f:
-                    pid = int(f.read().strip())
-                
-                # Check if the process with this PID is still running
-                if platform.system() == 'Windows':
-                    import subprocess
-                    from subprocess_helper import run_hidden
-                    # Check if process is running on Windows
-                    result = run_hidden(
-                        ['tasklist', '/FI', f'PID eq {pid}'],
-                        capture_output=True,
-                        text=True
-                    )
-                    if str(pid) in result.stdout:
-                        # Process is still running
-                        from PySide6.QtWidgets import QMessageBox
-                        msg = QMessageBox()
-                        msg.setIcon(QMessageBox.Warning)
-                        msg.setWindowTitle("Already Running")
-                        msg.setText("Laptop Testing Program is already running!")
-                        msg.setInformativeText("Please check your taskbar or close the existing instance before starting a new one.")
-                        msg.setStandardButtons(QMessageBox.Ok)
-                        msg.exec()
-                        sys.exit(1)
-                    else:
-                        # Process not running, remove stale lock file
-                        print(f"Removing stale lock file (PID {pid} not found)")
-                        os.remove(lock_file)
-                else:
-                    # For non-Windows systems
+        if platform.system() == 'Windows':
+            # A named mutex is checked and claimed atomically and can't go
+            # stale, so Windows needs no lock file at all
+            instance_mutex = acquire_instance_mutex()
+            if instance_mutex is None:
+                show_already_running_message()
+                sys.exit(1)
+        else:
+            lock_file = os.path.join(tempfile.gettempdir(), 'laptop_testing_program.lock')
+            
+            # Check if lock file exists and if the process is still running
+            if os.path.exists(lock_file):
+                try:
+                    # Read the PID from the lock file
+                    with open(lock_file, 'r') as f:
+                        pid = int(f.read().strip())
+                    
                     try:
                         os.kill(pid, 0)  # Check if process exists
                         # Process exists, show warning
-                        from PySide6.QtWidgets import QMessageBox
-                        msg = QMessageBox()
-                        msg.setIcon(QMessageBox.Warning)
-                        msg.setWindowTitle("Already Running")
-                        msg.setText("Laptop Testing Program is already running!")
-                        msg.setInformativeText("Please check your taskbar or close the existing instance before starting a new one.")
-                        msg.setStandardButtons(QMessageBox.Ok)
-                        msg.exec()
+                        show_already_running_message()
                         sys.exit(1)
                     except OSError:
                         # Process doesn't exist, remove stale lock file
                         print(f"Removing stale lock file (PID {pid} not found)")
                         os.remove(lock_file)
-            except (ValueError, FileNotFoundError):
-                # Invalid lock file, remove it
-                print("Removing invalid lock file")
-                try:
-                    os.remove(lock_file)
-                except:
-                    pass
-        
-        # Create lock file
-        with open(lock_file, 'w') as f:
-            f.write(str(os.getpid()))
+                except (ValueError, FileNotFoundError):
+                    # Invalid lock file, remove it
+                    print("Removing invalid lock file")
+                    try:
+                        os.remove(lock_file)
+                    except:
+                        pass
+            
+            # Create lock file
+            with open(lock_file, 'w') as f:
+                f.write(str(os.getpid()))
         
         # Create and show main window
         window = LaptopTestingApp()
@@ -2269,10 +2597,11 @@ def main():
         result = app.exec()
         
         # Clean up lock file
-        try:
-            os.remove(lock_file)
-        except:
-            pass
+        if lock_file:
+            try:
+                os.remove(lock_file)
+            except:
+                pass
             
         sys.exit(result)
         
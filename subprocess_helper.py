@@ -5,120 +5,270 @@ Provides utilities for running subprocess commands without showing terminal wind
 
 import subprocess
 import sys
-import platform
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Resolved once at import; sys.platform is a constant, unlike platform.system()
+_IS_WINDOWS = sys.platform == 'win32'
+
+# Bound once so each wrapper call skips the subprocess attribute lookup
+_run = subprocess.run
+_check_output = subprocess.check_output
+_popen = subprocess.Popen
+_call = subprocess.call
+
+# check_output_hidden results kept for callers that pass cache_ttl, oldest first
+_OUTPUT_CACHE_SIZE = 64
+_output_cache = {}
+_output_cache_lock = threading.Lock()
 
 # Windows-specific constants for hiding console windows
-if platform.system() == 'Windows':
-    import ctypes
-    from ctypes import wintypes
-    
+if _IS_WINDOWS:
     # Constants for CREATE_NO_WINDOW
     CREATE_NO_WINDOW = 0x08000000
     DETACHED_PROCESS = 0x00000008
     
-    # startupinfo to hide console window
+    # startupinfo to hide console window, built once and shared; Popen copies
+    # the STARTUPINFO it is given, so the shared instance is never mutated
+    _HIDDEN_STARTUPINFO = subprocess.STARTUPINFO()
+    _HIDDEN_STARTUPINFO.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    _HIDDEN_STARTUPINFO.wShowWindow = 0  # SW_HIDE
+    
     def get_startup_info():
         """Get startup info to hide console window"""
-        startupinfo = subprocess.STARTUPINFO()
-        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-        startupinfo.wShowWindow = 0  # SW_HIDE
-        return startupinfo
+        return _HIDDEN_STARTUPINFO
+    
+    def _apply_hidden(kwargs):
+        """Add the no-window flag and hidden startupinfo to Popen kwargs in place"""
+        # Combine flags to ensure no window is created
+        kwargs['creationflags'] = kwargs.get('creationflags', 0) | CREATE_NO_WINDOW
+        
+        # Always set startupinfo to hide window
+        kwargs.setdefault('startupinfo', _HIDDEN_STARTUPINFO)
 else:
     CREATE_NO_WINDOW = 0
     DETACHED_PROCESS = 0
+    _HIDDEN_STARTUPINFO = None
     
     def get_startup_info():
         """Return None for non-Windows systems"""
         return None
+    
+    def _apply_hidden(kwargs):
+        """No console windows to hide on non-Windows systems"""
 
 
-def run_hidden(cmd, **kwargs):
+def check_output_hidden(cmd, cache_ttl=None, **kwargs):
     """
-    Run a subprocess command without showing a terminal window
+    Run a subprocess command and capture output without showing a terminal window
     
     Args:
         cmd: Command to run (string or list)
-        **kwargs: Additional arguments to pass to subprocess.run()
+        cache_ttl: Seconds to reuse the output of an identical earlier call
+            (for read-only discovery commands); None always runs the command
+        **kwargs: Additional arguments to pass to subprocess.check_output()
     
     Returns:
-        subprocess.CompletedProcess object
+        bytes: Output from the command
     """
-    if platform.system() == 'Windows':
-        # Combine flags to ensure no window is created
-        existing_flags = kwargs.get('creationflags', 0)
-        kwargs['creationflags'] = existing_flags | CREATE_NO_WINDOW
+    if not cache_ttl:
+        _apply_hidden(kwargs)
+        return _check_output(cmd, **kwargs)
+    
+    key = (cmd if isinstance(cmd, str) else tuple(cmd),
+           tuple(sorted((name, repr(value)) for name, value in kwargs.items())))
+    with _output_cache_lock:
+        cached = _output_cache.get(key)
+    if cached and time.monotonic() - cached[0] < cache_ttl:
+        return cached[1]
+    
+    _apply_hidden(kwargs)
+    output = _check_output(cmd, **kwargs)
+    
+    with _output_cache_lock:
+        _output_cache.pop(key, None)
+        if len(_output_cache) >= _OUTPUT_CACHE_SIZE:
+            del _output_cache[next(iter(_output_cache))]
+        _output_cache[key] = (time.monotonic(), output)
+    return output
+
+
+# There is no console window to hide off Windows, so there run_hidden, Popen_hidden
+# and call_hidden are the subprocess functions themselves (check_output_hidden keeps
+# its cache_ttl on every platform)
+if _IS_WINDOWS:
+    def run_hidden(cmd, **kwargs):
+        """
+        Run a subprocess command without showing a terminal window
         
-        # Always set startupinfo to hide window
-        if 'startupinfo' not in kwargs:
-            kwargs['startupinfo'] = get_startup_info()
+        Args:
+            cmd: Command to run (string or list)
+            **kwargs: Additional arguments to pass to subprocess.run()
+        
+        Returns:
+            subprocess.CompletedProcess object
+        """
+        _apply_hidden(kwargs)
+        return _run(cmd, **kwargs)
+    
+    def Popen_hidden(cmd, **kwargs):
+        """
+        Create a subprocess.Popen object without showing a terminal window
+        
+        Args:
+            cmd: Command to run (string or list)
+            **kwargs: Additional arguments to pass to subprocess.Popen()
+        
+        Returns:
+            subprocess.Popen object
+        """
+        _apply_hidden(kwargs)
+        return _popen(cmd, **kwargs)
     
-    return subprocess.run(cmd, **kwargs)
+    def call_hidden(cmd, **kwargs):
+        """
+        Run a subprocess.call command without showing a terminal window
+        
+        Args:
+            cmd: Command to run (string or list)
+            **kwargs: Additional arguments to pass to subprocess.call()
+        
+        Returns:
+            int: Return code from the command
+        """
+        _apply_hidden(kwargs)
+        return _call(cmd, **kwargs)
+else:
+    run_hidden = _run
+    Popen_hidden = _popen
+    call_hidden = _call
 
 
-def check_output_hidden(cmd, **kwargs):
+def run_many(cmds, max_workers=8, **kwargs):
     """
-    Run a subprocess command and capture output without showing a terminal window
+    Run independent commands concurrently without showing terminal windows
     
     Args:
-        cmd: Command to run (string or list)
-        **kwargs: Additional arguments to pass to subprocess.check_output()
+        cmds: Commands to run (each a string or list)
+        max_workers: Most commands to have running at once
+        **kwargs: Additional arguments passed to subprocess.run() for every command
     
     Returns:
-        bytes: Output from the command
+        list: subprocess.CompletedProcess objects, in the same order as cmds
     """
-    if platform.system() == 'Windows':
-        # Combine flags to ensure no window is created
-        existing_flags = kwargs.get('creationflags', 0)
-        kwargs['creationflags'] = existing_flags | CREATE_NO_WINDOW
-        
-        # Always set startupinfo to hide window
-        if 'startupinfo' not in kwargs:
-            kwargs['startupinfo'] = get_startup_info()
+    cmds = list(cmds)
+    if not cmds:
+        return []
     
-    return subprocess.check_output(cmd, **kwargs)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(cmds))) as executor:
+        return list(executor.map(lambda cmd: run_hidden(cmd, **kwargs), cmds))
 
 
-def Popen_hidden(cmd, **kwargs):
+async def Popen_hidden_async(*cmd, **kwargs):
     """
-    Create a subprocess.Popen object without showing a terminal window
+    Start a subprocess from a coroutine without showing a terminal window
     
     Args:
-        cmd: Command to run (string or list)
-        **kwargs: Additional arguments to pass to subprocess.Popen()
+        *cmd: Program and its arguments
+        **kwargs: Additional arguments to pass to asyncio.create_subprocess_exec()
     
     Returns:
-        subprocess.Popen object
+        asyncio.subprocess.Process object
     """
-    if platform.system() == 'Windows':
-        # Combine flags to ensure no window is created
-        existing_flags = kwargs.get('creationflags', 0)
-        kwargs['creationflags'] = existing_flags | CREATE_NO_WINDOW
-        
-        # Always set startupinfo to hide window
-        if 'startupinfo' not in kwargs:
-            kwargs['startupinfo'] = get_startup_info()
+    # Only reachable from a running event loop, so asyncio is already loaded
+    import asyncio
     
-    return subprocess.Popen(cmd, **kwargs)
+    _apply_hidden(kwargs)
+    return await asyncio.create_subprocess_exec(*cmd, **kwargs)
 
 
-def call_hidden(cmd, **kwargs):
+async def run_hidden_async(*cmd, **kwargs):
     """
-    Run a subprocess.call command without showing a terminal window
+    Run a subprocess from a coroutine without showing a terminal window
     
     Args:
-        cmd: Command to run (string or list)
-        **kwargs: Additional arguments to pass to subprocess.call()
+        *cmd: Program and its arguments
+        **kwargs: Additional arguments to pass to asyncio.create_subprocess_exec()
     
     Returns:
-        int: Return code from the command
+        tuple: (returncode, stdout bytes, stderr bytes)
     """
-    if platform.system() == 'Windows':
-        # Combine flags to ensure no window is created
-        existing_flags = kwargs.get('creationflags', 0)
-        kwargs['creationflags'] = existing_flags | CREATE_NO_WINDOW
+    import asyncio
+    
+    kwargs.setdefault('stdout', asyncio.subprocess.PIPE)
+    kwargs.setdefault('stderr', asyncio.subprocess.PIPE)
+    process = await Popen_hidden_async(*cmd, **kwargs)
+    stdout, stderr = await process.communicate()
+    return process.returncode, stdout, stderr
+
+
+class PersistentShell:
+    """A long-lived PowerShell process that answers queries over stdin/stdout"""
+    SENTINEL = '<<END-OF-QUERY>>'
+    
+    def __init__(self, executable='powershell'):
+        self.args = [executable, '-NoProfile', '-NoLogo', '-NonInteractive', '-Command', '-']
+        self._process = None
+        self._lines = None
+        self._lock = threading.Lock()
+    
+    def _ensure_process(self):
+        """Start the shell, or restart it if it has exited"""
+        if self._process is not None and self._process.poll() is None:
+            return
         
-        # Always set startupinfo to hide window
-        if 'startupinfo' not in kwargs:
-            kwargs['startupinfo'] = get_startup_info()
+        self._process = Popen_hidden(self.args, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                     stderr=subprocess.DEVNULL, text=True, bufsize=1)
+        # A reader thread feeds stdout into a queue so queries can time out
+        self._lines = queue.Queue()
+        threading.Thread(target=self._pump, args=(self._process.stdout, self._lines), daemon=True).start()
+    
+    @staticmethod
+    def _pump(stdout, lines):
+        """Copy the shell's output lines into the queue until it exits"""
+        for line in stdout:
+            lines.put(line.rstrip('\r\n'))
+        lines.put(None)
+    
+    def query(self, command, timeout=10):
+        """
+        Run a command in the shell and wait for its output
+        
+        Args:
+            command: PowerShell command text
+            timeout: Seconds to wait before the shell is killed
+        
+        Returns:
+            tuple: (whether the command succeeded, stdout text)
+        """
+        with self._lock:
+            self._ensure_process()
+            self._process.stdin.write(f"{command}\nWrite-Output \"{self.SENTINEL} $?\"\n")
+            self._process.stdin.flush()
+            
+            output = []
+            deadline = time.monotonic() + timeout
+            while True:
+                try:
+                    line = self._lines.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    self.close()
+                    raise subprocess.TimeoutExpired(self.args, timeout)
+                
+                if line is None:
+                    self._process = None
+                    raise RuntimeError("PowerShell exited while running a query")
+                if line.startswith(self.SENTINEL):
+                    return line.endswith('True'), '\n'.join(output)
+                output.append(line)
     
-    return subprocess.call(cmd, **kwargs)
+    def close(self):
+        """Stop the shell process"""
+        if self._process is not None:
+            try:
+                self._process.kill()
+            except OSError:
+                pass
+            self._process = None
@@ -9,11 +9,21 @@ import threading
 import subprocess
 import os
 import tempfile
-import random
+import hashlib
+import mmap
+import zlib
+import logging
 from datetime import datetime
 from keyboard_test import KeyboardTest
-from subprocess_helper import run_hidden
-from subprocess_helper import run_hidden
+from subprocess_helper import PersistentShell
+
+# Try to import camera test
+try:
+    from camera_test import CameraTest
+    CAMERA_TEST_AVAILABLE = True
+except ImportError:
+    CAMERA_TEST_AVAILABLE = False
+    CameraTest = None
 
 # Try to import microphone test
 try:
@@ -23,14 +33,143 @@ except ImportError:
     MICROPHONE_TEST_AVAILABLE = False
     MicrophoneTest = None
 
+try:
+    from PySide6.QtCore import QMetaObject, Qt, QCoreApplication
+    PYSIDE6_AVAILABLE = True
+except ImportError:
+    PYSIDE6_AVAILABLE = False
+
+try:
+    import wmi
+    WMI_AVAILABLE = True
+except ImportError:
+    WMI_AVAILABLE = False
+
+try:
+    import speedtest
+    SPEEDTEST_AVAILABLE = True
+except ImportError:
+    SPEEDTEST_AVAILABLE = False
+
+log = logging.getLogger(__name__)
+
+# psutil sensor groups that report CPU package/core temperatures, by preference
+CPU_SENSOR_NAMES = ('coretemp', 'k10temp', 'zenpower', 'cpu_thermal')
+
+# Instructions shown while each window test opens
+CAMERA_INSTRUCTIONS = (
+    "Opening integrated camera test window...",
+    "Please verify that:",
+    "• Camera preview shows live video feed",
+    "• Image quality is clear and well-lit",
+    "• Use 'Open Camera App' for system camera",
+    "• Use 'Debug Camera Settings' for troubleshooting",
+)
+MICROPHONE_INSTRUCTIONS = (
+    "Opening microphone test window with waveform visualization...",
+    "Please verify that:",
+    "• Click 'Start Recording' to begin microphone capture",
+    "• Speak or make sounds to see waveform visualization",
+    "• Check volume level bar for input sensitivity",
+    "• Use 'Test System Audio' to verify speakers",
+    "• Use settings buttons for microphone configuration",
+)
+
+# Recommendations keyed by hardware thresholds, highest threshold first
+CPU_RECOMMENDATIONS = (
+    (4, "Run CPU stress test for 60 seconds to test multi-core performance"),
+    (float('-inf'), "Run CPU stress test for 30 seconds (fewer cores detected)"),
+)
+MEMORY_RECOMMENDATIONS = (
+    (8, "Run memory test with 500MB to test RAM stability"),
+    (float('-inf'), "Run memory test with 100MB (limited RAM detected)"),
+)
+GENERAL_RECOMMENDATIONS = (
+    "Run disk speed test to check storage performance",
+    "Run network speed test to check internet connectivity",
+    "Run system stability test for 5 minutes to check overall system health",
+)
+
 class SystemTests:
+    # Least seconds between progress callbacks from a test's inner loop
+    CALLBACK_INTERVAL = 0.1
+    # Seconds between CPU stress test samples and between stability checks;
+    # cpu_percent is read non-blocking, so these set the cadence on their own
+    CPU_SAMPLE_INTERVAL = 1
+    STABILITY_CHECK_INTERVAL = 5
+    # Seconds a speedtest server list and best-server pick are reused
+    SPEEDTEST_SERVER_TTL = 600
+    
     def __init__(self):
+        # Set while no test is running or a stop was requested, so worker
+        # sleeps can wait on it and wake as soon as a test is stopped
+        self._stop_event = threading.Event()
         self.is_testing = False
         self.test_results = {}
+        self._last_emit = 0
+        self._speedtest = None
+        self._speedtest_time = 0
+    
+    @property
+    def is_testing(self):
+        """Whether a test is running and hasn't been asked to stop"""
+        return not self._stop_event.is_set()
+    
+    @is_testing.setter
+    def is_testing(self, value):
+        if value:
+            self._stop_event.clear()
+        else:
+            self._stop_event.set()
+    
+    @staticmethod
+    def _window_test_results(test_name):
+        """Fresh results dict for a test that opens its own window"""
+        return {
+            'test_name': test_name,
+            'start_time': datetime.now(),
+            'status': 'Running',
+            'progress': 0,
+            'errors': [],
+            'instructions': []
+        }
+    
+    def wait_until_stopped(self, timeout=None):
+        """Block until the running test finishes or is stopped; False on timeout"""
+        return self._stop_event.wait(timeout)
+    
+    def _cpu_sensor_name(self):
+        """Name of the psutil sensor group reporting CPU temperatures, or None"""
+        try:
+            temps = psutil.sensors_temperatures()
+        except (AttributeError, OSError):
+            # psutil has no temperature sensors on Windows
+            return None
+        return next((name for name in CPU_SENSOR_NAMES if temps.get(name)), None)
+    
+    @staticmethod
+    def _snapshot(results):
+        """Copy of results the UI can read while the worker keeps updating the original"""
+        return {key: value.copy() if isinstance(value, (list, dict)) else value
+                for key, value in results.items()}
+    
+    def _snapshotting(self, callback):
+        """Wrap a test callback so each call gets a snapshot, not the live results dict"""
+        if callback is None:
+            return None
+        return lambda results: callback(self._snapshot(results))
+    
+    def _emit(self, callback, results):
+        """Forward progress to callback, coalescing updates closer than CALLBACK_INTERVAL"""
+        now = time.monotonic()
+        if results.get('progress') == 100 or now - self._last_emit >= self.CALLBACK_INTERVAL:
+            self._last_emit = now
+            callback(results)
     
     def cpu_stress_test(self, duration=30, callback=None):
         """Run CPU stress test for specified duration"""
         self.is_testing = True
+        callback = self._snapshotting(callback)
         results = {
             'test_name': 'CPU Stress Test',
             'duration': duration,
@@ -43,28 +182,41 @@ class SystemTests:
         }
         
         def stress_worker():
-            # CPU intensive task
+            # CPU intensive task; hashlib releases the GIL while hashing a large
+            # buffer, so each thread keeps its own core busy instead of taking
+            # turns on the interpreter like pure-Python arithmetic does
+            block = os.urandom(1024 * 1024)
             end_time = time.time() + duration
             while time.time() < end_time and self.is_testing:
-                # Perform CPU intensive calculations
-                for _ in range(10000):
-                    _ = sum(i*i for i in range(100))
+                hashlib.sha256(block).digest()
         
         def monitor_worker():
-            start_time = time.time()
+            start_time = time.monotonic()
+            next_sample = start_time
             sample_count = 0
             total_usage = 0
             
-            while time.time() - start_time < duration and self.is_testing:
+            # Prime cpu_percent so each later call returns the usage since the
+            # previous one without blocking for its own interval
+            psutil.cpu_percent(interval=None)
+            # Find the CPU's sensor group once rather than on every sample
+            sensor_name = self._cpu_sensor_name()
+            
+            while next_sample - start_time < duration and self.is_testing:
+                # Sample on fixed ticks so probe time doesn't add drift
+                next_sample += self.CPU_SAMPLE_INTERVAL
+                if self._stop_event.wait(max(0, next_sample - time.monotonic())):
+                    break
+                
                 # Calculate progress
-                elapsed_time = time.time() - start_time
+                elapsed_time = time.monotonic() - start_time
                 progress = int((elapsed_time / duration) * 100)
                 results['progress'] = min(progress, 100)
                 
                 # Get CPU usage
-                cpu_usage = psutil.cpu_percent(interval=1)
+                cpu_usage = psutil.cpu_percent(interval=None)
                 results['cpu_usage_samples'].append({
-                    'time': time.time() - start_time,
+                    'time': elapsed_time,
                     'usage': cpu_usage
                 })
                 
@@ -75,21 +227,21 @@ class SystemTests:
                     results['max_usage'] = cpu_usage
                 
                 # Get CPU temperature if available
-                try:
-                    temps = psutil.sensors_temperatures()
-                    if 'coretemp' in temps:
-                        temp = max(temp.current for temp in temps['coretemp'])
+                if sensor_name:
+                    try:
+                        entries = psutil.sensors_temperatures().get(sensor_name)
+                    except OSError as e:
+                        log.debug("Temperature read failed, no longer sampling: %s", e)
+                        sensor_name = None
+                        entries = None
+                    if entries:
                         results['cpu_temperatures'].append({
-                            'time': time.time() - start_time,
-                            'temperature': temp
+                            'time': elapsed_time,
+                            'temperature': max(entry.current for entry in entries)
                         })
-                except:
-                    pass
                 
                 if callback:
                     callback(results)
-                
-                time.sleep(1)
             
             results['avg_usage'] = total_usage / sample_count if sample_count > 0 else 0
             results['progress'] = 100  # Ensure final progress is 100%
@@ -120,6 +272,7 @@ class SystemTests:
     def memory_test(self, test_size_mb=100, callback=None):
         """Run memory test by allocating and testing memory blocks"""
         self.is_testing = True
+        callback = self._snapshotting(callback)
         results = {
             'test_name': 'Memory Test',
             'test_size_mb': test_size_mb,
@@ -134,16 +287,22 @@ class SystemTests:
             try:
                 block_size = 1024 * 1024  # 1MB blocks
                 num_blocks = test_size_mb
-                memory_blocks = []
+                # One anonymous mapping for the whole test, carved into blocks,
+                # instead of a separate heap allocation per block
+                memory = mmap.mmap(-1, num_blocks * block_size)
+                view = memoryview(memory)
+                block_crcs = []
                 
-                # Allocate memory blocks
+                # Fill memory blocks
                 for i in range(num_blocks):
                     if not self.is_testing:
                         break
                     
-                    # Create random data
-                    data = bytearray(random.getrandbits(8) for _ in range(block_size))
-                    memory_blocks.append(data)
+                    # Write random data, filled in C rather than a byte at a time
+                    start = i * block_size
+                    view[start:start + block_size] = os.urandom(block_size)
+                    # Keep the block's CRC so the verify pass can detect changes
+                    block_crcs.append(zlib.crc32(view[start:start + block_size]))
                     
                     results['blocks_tested'] = i + 1
                     # Calculate progress for allocation phase (0-50%)
@@ -158,34 +317,27 @@ class SystemTests:
                     })
                     
                     if callback:
-                        callback(results)
-                    
-                    time.sleep(0.1)
+                        self._emit(callback, results)
                 
                 # Test memory blocks
-                for i, block in enumerate(memory_blocks):
+                for i, expected_crc in enumerate(block_crcs):
                     if not self.is_testing:
                         break
                     
-                    # Verify data integrity
-                    try:
-                        # Simple checksum test
-                        checksum = sum(block) % 256
-                        if checksum != sum(block) % 256:
-                            results['errors_found'] += 1
-                    except Exception:
+                    # Verify data integrity against the CRC taken at allocation
+                    start = i * block_size
+                    if zlib.crc32(view[start:start + block_size]) != expected_crc:
                         results['errors_found'] += 1
                     
                     # Calculate progress for testing phase (50-100%)
-                    results['progress'] = int(50 + (i + 1) / len(memory_blocks) * 50)
+                    results['progress'] = int(50 + (i + 1) / len(block_crcs) * 50)
                     
                     if callback:
-                        callback(results)
-                    
-                    time.sleep(0.05)
+                        self._emit(callback, results)
                 
                 # Clean up
-                del memory_blocks
+                view.release()
+                memory.close()
                 
                 results['progress'] = 100  # Ensure final progress is 100%
                 results['end_time'] = datetime.now()
@@ -211,6 +363,7 @@ class SystemTests:
     def disk_speed_test(self, test_file_size_mb=100, callback=None):
         """Run disk speed test by writing and reading files"""
         self.is_testing = True
+        callback = self._snapshotting(callback)
         results = {
             'test_name': 'Disk Speed Test',
             'test_file_size_mb': test_file_size_mb,
@@ -230,78 +383,87 @@ class SystemTests:
                 temp_path = temp_file.name
                 temp_file.close()
                 
-                print(f"DEBUG: Created temp file at: {temp_path}")
+                log.debug("Created temp file at: %s", temp_path)
                 
-                # Test data
-                test_data = b'0' * (1024 * 1024)  # 1MB of data
+                # Test data, written and read in 4MB blocks straight on the file
+                # descriptor so Python's buffered file layer stays out of the timing
+                block_size = 4 * 1024 * 1024
+                # Incompressible data, so drives and filesystems that compress or
+                # dedupe writes can't shortcut the test
+                test_data = os.urandom(block_size)
+                total_bytes = test_file_size_mb * 1024 * 1024
+                num_blocks = -(-total_bytes // block_size)
+                binary_flag = getattr(os, 'O_BINARY', 0)
                 
                 # Write test
-                print(f"DEBUG: Starting write test for {test_file_size_mb}MB")
+                log.debug("Starting write test for %sMB", test_file_size_mb)
                 write_start = time.time()
-                with open(temp_path, 'wb') as f:
-                    for i in range(test_file_size_mb):
+                fd = os.open(temp_path, os.O_WRONLY | os.O_TRUNC | binary_flag)
+                try:
+                    for i in range(num_blocks):
                         if not self.is_testing:
-                            print("DEBUG: Write test stopped by user")
+                            log.debug("Write test stopped by user")
                             break
-                        f.write(test_data)
+                        remaining = total_bytes - i * block_size
+                        os.write(fd, test_data if remaining >= block_size else test_data[:remaining])
                         # Calculate write progress (0-50%)
-                        write_progress = int((i + 1) / test_file_size_mb * 50)
+                        write_progress = int((i + 1) / num_blocks * 50)
                         results['progress'] = write_progress
-                        # Only update progress every 5MB or at the end to reduce callback frequency
-                        if (i + 1) % 5 == 0 or i == test_file_size_mb - 1:
-                            if callback:
-                                print(f"DEBUG: Write progress callback: {write_progress}%")
-                                callback(results)
+                        if callback:
+                            self._emit(callback, results)
+                    
+                    # Time the data reaching the disk, not just the page cache
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
                 
                 write_end = time.time()
                 write_time = write_end - write_start
                 results['write_speed_mbps'] = test_file_size_mb / write_time if write_time > 0 else 0
-                print(f"DEBUG: Write completed - Speed: {results['write_speed_mbps']:.2f} MB/s")
+                log.debug("Write completed - Speed: %.2f MB/s", results['write_speed_mbps'])
                 
                 # Read test
-                print(f"DEBUG: Starting read test")
+                log.debug("Starting read test")
                 read_start = time.time()
-                with open(temp_path, 'rb') as f:
-                    for i in range(test_file_size_mb):
+                fd = os.open(temp_path, os.O_RDONLY | binary_flag)
+                try:
+                    for i in range(num_blocks):
                         if not self.is_testing:
-                            print("DEBUG: Read test stopped by user")
+                            log.debug("Read test stopped by user")
                             break
-                        f.read(1024 * 1024)
+                        os.read(fd, block_size)
                         # Calculate read progress (50-100%)
-                        read_progress = int(50 + (i + 1) / test_file_size_mb * 50)
+                        read_progress = int(50 + (i + 1) / num_blocks * 50)
                         results['progress'] = read_progress
-                        # Only update progress every 5MB or at the end to reduce callback frequency
-                        if (i + 1) % 5 == 0 or i == test_file_size_mb - 1:
-                            if callback:
-                                print(f"DEBUG: Read progress callback: {read_progress}%")
-                                callback(results)
+                        if callback:
+                            self._emit(callback, results)
+                finally:
+                    os.close(fd)
                 
                 read_end = time.time()
                 read_time = read_end - read_start
                 results['read_speed_mbps'] = test_file_size_mb / read_time if read_time > 0 else 0
-                print(f"DEBUG: Read completed - Speed: {results['read_speed_mbps']:.2f} MB/s")
+                log.debug("Read completed - Speed: %.2f MB/s", results['read_speed_mbps'])
                 
                 # Clean up
-                print(f"DEBUG: Cleaning up temp file: {temp_path}")
+                log.debug("Cleaning up temp file: %s", temp_path)
                 try:
                     os.unlink(temp_path)
-                    print("DEBUG: Temp file deleted successfully")
+                    log.debug("Temp file deleted successfully")
                 except Exception as cleanup_error:
-                    print(f"DEBUG: Error deleting temp file: {cleanup_error}")
+                    log.debug("Error deleting temp file: %s", cleanup_error)
                 
                 results['end_time'] = datetime.now()
                 results['status'] = 'Completed' if self.is_testing else 'Stopped'
                 results['progress'] = 100
                 self.is_testing = False
                 
-                print(f"DEBUG: Test completed, final callback")
+                log.debug("Test completed, final callback")
                 if callback:
                     callback(results)
                     
             except Exception as e:
-                print(f"DEBUG: Exception in disk_test_worker: {e}")
-                import traceback
-                traceback.print_exc()
+                log.exception("Exception in disk_test_worker")
                 results['error'] = str(e)
                 results['status'] = 'Error'
                 self.is_testing = False
@@ -317,6 +479,7 @@ class SystemTests:
     def network_speed_test(self, callback=None):
         """Run network speed test using speedtest-cli"""
         self.is_testing = True
+        callback = self._snapshotting(callback)
         results = {
             'test_name': 'Network Speed Test',
             'start_time': datetime.now(),
@@ -329,17 +492,26 @@ class SystemTests:
         
         def network_test_worker():
             try:
-                import speedtest
-                
-                # Initialize speedtest
-                st = speedtest.Speedtest()
-                
-                if callback:
-                    results['status'] = 'Finding best server...'
-                    callback(results)
-                
-                # Get best server
-                st.get_best_server()
+                if not SPEEDTEST_AVAILABLE:
+                    raise ImportError("speedtest-cli is not installed")
+                
+                # Reuse the last run's server discovery while it is fresh
+                st = self._speedtest
+                if st is None or time.monotonic() - self._speedtest_time > self.SPEEDTEST_SERVER_TTL:
+                    # Initialize speedtest
+                    st = speedtest.Speedtest()
+                    
+                    if callback:
+                        results['status'] = 'Finding best server...'
+                        callback(results)
+                    
+                    # Get best server
+                    st.get_best_server()
+                    self._speedtest = st
+                    self._speedtest_time = time.monotonic()
+                else:
+                    # Re-ping only the cached best server so this run reports its own latency
+                    st.get_best_server([st.best])
                 results['server_info'] = st.results.server
                 
                 if callback:
@@ -384,6 +556,7 @@ class SystemTests:
     def system_stability_test(self, duration=300, callback=None):
         """Run comprehensive system stability test"""
         self.is_testing = True
+        callback = self._snapshotting(callback)
         results = {
             'test_name': 'System Stability Test',
             'duration': duration,
@@ -398,12 +571,31 @@ class SystemTests:
         }
         
         def stability_test_worker():
-            start_time = time.time()
+            start_time = time.monotonic()
+            next_check = start_time
             
-            while time.time() - start_time < duration and self.is_testing:
+            # Prime cpu_percent; each check then reports the average since the last
+            psutil.cpu_percent(interval=None)
+            
+            # Mounted partitions and sensor support don't change during a run,
+            # so look them up once instead of on every check
+            partitions = psutil.disk_partitions()
+            try:
+                have_temps = bool(psutil.sensors_temperatures())
+            except (AttributeError, OSError):
+                # psutil has no temperature sensors on Windows
+                have_temps = False
+            
+            while next_check - start_time < duration and self.is_testing:
+                # Check on fixed ticks, measured from the start rather than the
+                # end of the previous check
+                next_check += self.STABILITY_CHECK_INTERVAL
+                if self._stop_event.wait(max(0, next_check - time.monotonic())):
+                    break
+                
                 try:
                     # Check CPU usage
-                    cpu_usage = psutil.cpu_percent(interval=1)
+                    cpu_usage = psutil.cpu_percent(interval=None)
                     if cpu_usage > 95:
                         results['cpu_stable'] = False
                         results['errors'].append(f"High CPU usage: {cpu_usage}%")
@@ -415,34 +607,33 @@ class SystemTests:
                         results['errors'].append(f"High memory usage: {memory.percent}%")
                     
                     # Check disk usage
-                    for partition in psutil.disk_partitions():
+                    for partition in partitions:
                         try:
                             usage = psutil.disk_usage(partition.mountpoint)
                             if usage.percent > 95:
                                 results['disk_stable'] = False
                                 results['errors'].append(f"High disk usage: {usage.percent}% on {partition.device}")
-                        except:
+                        except OSError:
+                            # Empty card readers and optical drives can't be queried
                             continue
                     
                     # Check temperature
-                    try:
-                        temps = psutil.sensors_temperatures()
-                        if temps:
-                            for name, entries in temps.items():
-                                for entry in entries:
-                                    if entry.current > results['max_temperature']:
-                                        results['max_temperature'] = entry.current
-                                    if entry.current > 80:  # 80Â°C threshold
-                                        results['temperature_stable'] = False
-                                        results['errors'].append(f"High temperature: {entry.current}Â°C")
-                    except:
-                        pass
+                    if have_temps:
+                        try:
+                            temps = psutil.sensors_temperatures()
+                            hottest = max((entry.current for entries in temps.values() for entry in entries),
+                                          default=0)
+                            if hottest > results['max_temperature']:
+                                results['max_temperature'] = hottest
+                            if hottest > 80:  # 80°C threshold
+                                results['temperature_stable'] = False
+                                results['errors'].append(f"High temperature: {hottest}°C")
+                        except OSError:
+                            have_temps = False
                     
                     if callback:
                         callback(results)
                     
-                    time.sleep(5)
-                    
                 except Exception as e:
                     results['errors'].append(f"Stability test error: {str(e)}")
             
@@ -459,9 +650,54 @@ class SystemTests:
         
         return results
     
+    def _connect_brightness_wmi(self):
+        """Connect to root/WMI for this thread; returns (connection or None, COM initialized)"""
+        if not WMI_AVAILABLE:
+            return None, False
+        try:
+            import pythoncom
+            pythoncom.CoInitialize()
+        except Exception:
+            return None, False
+        try:
+            return wmi.WMI(namespace='root\\wmi'), True
+        except Exception:
+            return None, True
+    
+    def _get_brightness(self, connection, shell):
+        """Read the current brightness level, or None if it can't be detected"""
+        if connection is not None:
+            try:
+                return int(connection.WmiMonitorBrightness()[0].CurrentBrightness)
+            except Exception:
+                pass
+        
+        # Fall back to the test's PowerShell session when WMI can't be used in-process
+        success, output = shell.query(
+            '(Get-WmiObject -Namespace root/WMI -Class WmiMonitorBrightness).CurrentBrightness')
+        if success and output.strip():
+            return int(output.strip())
+        return None
+    
+    def _set_brightness(self, connection, shell, level):
+        """Set the brightness level, returning (success, error message)"""
+        if connection is not None:
+            try:
+                connection.WmiMonitorBrightnessMethods()[0].WmiSetBrightness(Timeout=1, Brightness=level)
+                return True, None
+            except Exception:
+                pass
+        
+        success, _ = shell.query(
+            f'(Get-WmiObject -Namespace root/WMI -Class WmiMonitorBrightnessMethods).WmiSetBrightness(1,{level})')
+        if success:
+            return True, None
+        return False, 'PowerShell could not set the brightness'
+    
     def brightness_test(self, callback=None):
         """Test brightness controls by cycling through different levels"""
         self.is_testing = True
+        callback = self._snapshotting(callback)
         results = {
             'test_name': 'Brightness Test',
             'start_time': datetime.now(),
@@ -474,6 +710,13 @@ class SystemTests:
         }
         
         def brightness_test_worker():
+            # WMI connection, and the PowerShell session used when WMI fails,
+            # reused for every read and set in this run; the session only
+            # starts if a query actually falls back to it
+            connection = None
+            com_initialized = False
+            shell = PersistentShell()
+            
             try:
                 import sys
                 
@@ -481,16 +724,13 @@ class SystemTests:
                 try:
                     if sys.platform == "win32":
                         # Windows brightness control using WMI
-                        result = run_hidden([
-                            'powershell', '-Command',
-                            '(Get-WmiObject -Namespace root/WMI -Class WmiMonitorBrightness).CurrentBrightness'
-                        ], capture_output=True, text=True, timeout=10)
+                        connection, com_initialized = self._connect_brightness_wmi()
+                        original_brightness = self._get_brightness(connection, shell)
                         
-                        if result.returncode == 0 and result.stdout.strip():
-                            original_brightness = int(result.stdout.strip())
+                        if original_brightness is not None:
                             results['original_brightness'] = original_brightness
                             results['brightness_support'] = True
-                            print(f"DEBUG: Current brightness: {original_brightness}%")
+                            log.debug("Current brightness: %s%%", original_brightness)
                         else:
                             results['errors'].append("Could not detect current brightness level")
                             results['brightness_support'] = False
@@ -519,25 +759,22 @@ class SystemTests:
                         break
                     
                     try:
-                        print(f"DEBUG: Setting brightness to {level}%")
-                        # Set brightness using PowerShell
-                        result = run_hidden([
-                            'powershell', '-Command',
-                            f'(Get-WmiObject -Namespace root/WMI -Class WmiMonitorBrightnessMethods).WmiSetBrightness(1,{level})'
-                        ], capture_output=True, text=True, timeout=10)
+                        log.debug("Setting brightness to %s%%", level)
+                        # Set brightness through WMI
+                        success, error = self._set_brightness(connection, shell, level)
                         
-                        if result.returncode == 0:
+                        if success:
                             results['brightness_levels_tested'].append({
                                 'level': level,
                                 'success': True,
                                 'timestamp': datetime.now()
                             })
-                            print(f"DEBUG: Successfully set brightness to {level}%")
+                            log.debug("Successfully set brightness to %s%%", level)
                         else:
                             results['brightness_levels_tested'].append({
                                 'level': level,
                                 'success': False,
-                                'error': result.stderr.strip() if result.stderr else 'Unknown error',
+                                'error': error,
                                 'timestamp': datetime.now()
                             })
                             results['errors'].append(f"Failed to set brightness to {level}%")
@@ -549,7 +786,7 @@ class SystemTests:
                             callback(results)
                         
                         # Wait a moment to see the brightness change
-                        time.sleep(2)
+                        self._stop_event.wait(2)
                         
                     except Exception as e:
                         results['errors'].append(f"Error setting brightness to {level}%: {str(e)}")
@@ -563,14 +800,11 @@ class SystemTests:
                 # Restore original brightness
                 if results['original_brightness'] is not None:
                     try:
-                        print(f"DEBUG: Restoring brightness to {results['original_brightness']}%")
-                        result = run_hidden([
-                            'powershell', '-Command',
-                            f'(Get-WmiObject -Namespace root/WMI -Class WmiMonitorBrightnessMethods).WmiSetBrightness(1,{results["original_brightness"]})'
-                        ], capture_output=True, text=True, timeout=10)
+                        log.debug("Restoring brightness to %s%%", results['original_brightness'])
+                        success, _ = self._set_brightness(connection, shell, results['original_brightness'])
                         
-                        if result.returncode == 0:
-                            print("DEBUG: Successfully restored original brightness")
+                        if success:
+                            log.debug("Successfully restored original brightness")
                         else:
                             results['errors'].append("Failed to restore original brightness")
                             
@@ -586,14 +820,20 @@ class SystemTests:
                     callback(results)
                     
             except Exception as e:
-                print(f"DEBUG: Exception in brightness_test_worker: {e}")
-                import traceback
-                traceback.print_exc()
+                log.exception("Exception in brightness_test_worker")
                 results['error'] = str(e)
                 results['status'] = 'Error'
                 self.is_testing = False
                 if callback:
                     callback(results)
+            
+            finally:
+                shell.close()
+                # Release the WMI objects before uninitializing COM on this thread
+                connection = None
+                if com_initialized:
+                    import pythoncom
+                    pythoncom.CoUninitialize()
         
         thread = threading.Thread(target=brightness_test_worker)
         thread.daemon = True
@@ -604,6 +844,7 @@ class SystemTests:
     def charging_test(self, callback=None):
         """Test charging functionality by monitoring battery status changes"""
         self.is_testing = True
+        callback = self._snapshotting(callback)
         results = {
             'test_name': 'Charging Test',
             'start_time': datetime.now(),
@@ -639,7 +880,7 @@ class SystemTests:
                     results['initial_charging_state'] = battery.power_plugged
                     results['initial_battery_level'] = battery.percent
                     
-                    print(f"DEBUG: Initial battery state - Charging: {battery.power_plugged}, Level: {battery.percent}%")
+                    log.debug("Initial battery state - Charging: %s, Level: %s%%", battery.power_plugged, battery.percent)
                     
                 except Exception as e:
                     results['errors'].append(f"Error detecting battery: {str(e)}")
@@ -673,11 +914,13 @@ class SystemTests:
                         battery = psutil.sensors_battery()
                         current_charging = battery.power_plugged
                         current_level = battery.percent
-                        timestamp = datetime.now()
-                        current_time = time.time()
+                        current_time = time.monotonic()
+                        # Wall-clock stamp, only taken when an event is recorded
+                        timestamp = None
                         
                         # Detect charging state changes
                         if current_charging != last_charging_state:
+                            timestamp = datetime.now()
                             event = {
                                 'timestamp': timestamp,
                                 'event': 'plugged_in' if current_charging else 'unplugged',
@@ -685,11 +928,12 @@ class SystemTests:
                                 'charging_state': current_charging
                             }
                             results['charging_events'].append(event)
-                            print(f"DEBUG: Charging event detected - {event['event']} at {current_level}%")
+                            log.debug("Charging event detected - %s at %s%%", event['event'], current_level)
                             last_charging_state = current_charging
                         
                         # Track battery level changes
                         if abs(current_level - last_battery_level) >= 1:  # 1% change threshold
+                            timestamp = timestamp or datetime.now()
                             level_change = {
                                 'timestamp': timestamp,
                                 'old_level': last_battery_level,
@@ -698,7 +942,7 @@ class SystemTests:
                                 'charging': current_charging
                             }
                             results['battery_level_changes'].append(level_change)
-                            print(f"DEBUG: Battery level change - {last_battery_level}% â†’ {current_level}% (charging: {current_charging})")
+                            log.debug("Battery level change - %s%% → %s%% (charging: %s)", last_battery_level, current_level, current_charging)
                             last_battery_level = current_level
                         
                         # Update progress
@@ -710,16 +954,15 @@ class SystemTests:
                         
                         # Throttle callbacks to prevent recursive repaint issues
                         if callback and (current_time - last_callback_time >= 1.0):
-                            # Make a copy to avoid reference issues
-                            callback_results = dict(results)
-                            callback(callback_results)
+                            callback(results)
                             last_callback_time = current_time
                         
-                        time.sleep(check_interval)
+                        if self._stop_event.wait(check_interval):
+                            break
                         
                     except Exception as e:
                         results['errors'].append(f"Error during monitoring: {str(e)}")
-                        print(f"DEBUG: Monitoring error: {e}")
+                        log.debug("Monitoring error: %s", e)
                 
                 # Analyze results
                 results['charging_events_detected'] = len(results['charging_events'])
@@ -751,9 +994,7 @@ class SystemTests:
                     callback(results)
                     
             except Exception as e:
-                print(f"DEBUG: Exception in charging_test_worker: {e}")
-                import traceback
-                traceback.print_exc()
+                log.exception("Exception in charging_test_worker")
                 results['error'] = str(e)
                 results['status'] = 'Error'
                 self.is_testing = False
@@ -773,196 +1014,92 @@ class SystemTests:
 
     def camera_test(self, callback=None):
         """Test camera functionality with integrated preview window"""
-        self.is_testing = True
-        results = {
-            'test_name': 'Camera Test',
-            'start_time': datetime.now(),
-            'status': 'Running',
-            'progress': 0,
-            'errors': [],
-            'instructions': []
-        }
-        
-        def camera_test_worker():
-            try:
-                # Add instructions
-                results['instructions'].append("Opening integrated camera test window...")
-                results['instructions'].append("Please verify that:")
-                results['instructions'].append("• Camera preview shows live video feed")
-                results['instructions'].append("• Image quality is clear and well-lit")
-                results['instructions'].append("• Use 'Open Camera App' for system camera")
-                results['instructions'].append("• Use 'Debug Camera Settings' for troubleshooting")
-                results['progress'] = 25
-                
-                if callback:
-                    callback(results)
-                
-                # Import here to avoid issues
-                from camera_test import CameraTest
-                
-                # Create camera test in main thread using Qt's moveToThread mechanism
-                import threading
-                
-                # This will store the result from the main thread
-                camera_result = {'success': False, 'error': None, 'window_opened': False}
-                
-                def create_camera_in_main_thread():
-                    """Create camera test window in main thread"""
-                    try:
-                        camera_test = CameraTest()
-                        test_results = camera_test.run_test()
-                        camera_result['success'] = True
-                        camera_result['window_opened'] = test_results.get('window_opened', False)
-                        if test_results.get('errors'):
-                            camera_result['error'] = '; '.join(test_results['errors'])
-                    except Exception as e:
-                        camera_result['error'] = str(e)
-                
-                # Use Qt's invoke method to run in main thread
-                try:
-                    from PySide6.QtCore import QMetaObject, Qt, QCoreApplication
-                    
-                    # Try to invoke in main thread if Qt app exists
-                    if QCoreApplication.instance():
-                        QMetaObject.invokeMethod(
-                            QCoreApplication.instance(),
-                            create_camera_in_main_thread,
-                            Qt.QueuedConnection
-                        )
-                        
-                        # Wait a bit for the main thread operation
-                        time.sleep(1)
-                    else:
-                        # Fallback: create directly (might cause issues but worth trying)
-                        create_camera_in_main_thread()
-                        
-                except Exception as e:
-                    # Last resort fallback
-                    camera_result['error'] = f"Qt invocation failed: {str(e)}"
-                
-                # Process results
-                if camera_result['success'] or camera_result['window_opened']:
-                    results['status'] = 'Completed'
-                    results['progress'] = 100
-                    results['camera_opened'] = True
-                    results['instructions'].append("✅ Camera test window opened successfully")
-                    results['instructions'].append("💡 Test camera functionality in the opened window")
-                elif camera_result['error']:
-                    results['status'] = 'Error'
-                    results['errors'].append(f"Camera test error: {camera_result['error']}")
-                else:
-                    results['status'] = 'Error'
-                    results['errors'].append("Unknown error in camera test")
-                
-                results['end_time'] = datetime.now()
-                
-                if callback:
-                    callback(results)
-                
-            except Exception as e:
-                results['status'] = 'Error'
-                results['errors'].append(f"Camera test error: {str(e)}")
-                results['end_time'] = datetime.now()
-                
-                if callback:
-                    callback(results)
-            
-            finally:
-                self.is_testing = False
-        
-        thread = threading.Thread(target=camera_test_worker)
-        thread.daemon = True
-        thread.start()
-        
-        return results
+        return self._run_window_test(CameraTest, 'Camera', CAMERA_INSTRUCTIONS, callback)
 
     def microphone_test(self, callback=None):
         """Test microphone functionality with waveform visualization"""
+        return self._run_window_test(
+            MicrophoneTest, 'Microphone', MICROPHONE_INSTRUCTIONS, callback,
+            install_hint="Install required packages: pip install pyaudio matplotlib numpy"
+        )
+
+    def _run_window_test(self, test_class, label, instructions, callback, install_hint=None):
+        """Open test_class's window on the GUI thread and report whether it opened"""
         self.is_testing = True
-        results = {
-            'test_name': 'Microphone Test',
-            'start_time': datetime.now(),
-            'status': 'Running',
-            'progress': 0,
-            'errors': [],
-            'instructions': []
-        }
+        callback = self._snapshotting(callback)
+        results = self._window_test_results(f'{label} Test')
         
-        def microphone_test_worker():
+        def window_test_worker():
             try:
-                # Check if microphone test is available
-                if not MICROPHONE_TEST_AVAILABLE:
+                # Check if the test window module is available
+                if test_class is None:
                     results['status'] = 'Error'
-                    results['errors'].append("Microphone test module not available")
-                    results['instructions'].append("Install required packages: pip install pyaudio matplotlib numpy")
+                    results['errors'].append(f"{label} test module not available")
+                    if install_hint:
+                        results['instructions'].append(install_hint)
                     results['end_time'] = datetime.now()
                     if callback:
                         callback(results)
                     return
                 
                 # Add instructions
-                results['instructions'].append("Opening microphone test window with waveform visualization...")
-                results['instructions'].append("Please verify that:")
-                results['instructions'].append("• Click 'Start Recording' to begin microphone capture")
-                results['instructions'].append("• Speak or make sounds to see waveform visualization")
-                results['instructions'].append("• Check volume level bar for input sensitivity")
-                results['instructions'].append("• Use 'Test System Audio' to verify speakers")
-                results['instructions'].append("• Use settings buttons for microphone configuration")
+                results['instructions'].extend(instructions)
                 results['progress'] = 25
                 
                 if callback:
                     callback(results)
                 
                 # This will store the result from the main thread
-                microphone_result = {'success': False, 'error': None, 'window_opened': False}
+                window_result = {'success': False, 'error': None, 'window_opened': False}
+                window_ready = threading.Event()
                 
-                def create_microphone_in_main_thread():
-                    """Create microphone test window in main thread"""
+                def create_window_in_main_thread():
+                    """Create the test window in main thread"""
                     try:
-                        microphone_test = MicrophoneTest()
-                        test_results = microphone_test.run_test()
-                        microphone_result['success'] = True
-                        microphone_result['window_opened'] = test_results.get('window_opened', False)
+                        test_results = test_class().run_test()
+                        window_result['success'] = True
+                        window_result['window_opened'] = test_results.get('window_opened', False)
                         if test_results.get('errors'):
-                            microphone_result['error'] = '; '.join(test_results['errors'])
+                            window_result['error'] = '; '.join(test_results['errors'])
                     except Exception as e:
-                        microphone_result['error'] = str(e)
+                        window_result['error'] = str(e)
+                    finally:
+                        window_ready.set()
                 
                 # Use Qt's invoke method to run in main thread
                 try:
-                    from PySide6.QtCore import QMetaObject, Qt, QCoreApplication
-                    
                     # Try to invoke in main thread if Qt app exists
-                    if QCoreApplication.instance():
+                    if PYSIDE6_AVAILABLE and QCoreApplication.instance():
                         QMetaObject.invokeMethod(
                             QCoreApplication.instance(),
-                            create_microphone_in_main_thread,
+                            create_window_in_main_thread,
                             Qt.QueuedConnection
                         )
                         
-                        # Wait a bit for the main thread operation
-                        time.sleep(1)
+                        # Wait for the main thread to open the window (or fail)
+                        if not window_ready.wait(10):
+                            window_result['error'] = "Main-thread invoke timed out"
                     else:
                         # Fallback: create directly (might cause issues but worth trying)
-                        create_microphone_in_main_thread()
+                        create_window_in_main_thread()
                         
                 except Exception as e:
                     # Last resort fallback
-                    microphone_result['error'] = f"Qt invocation failed: {str(e)}"
+                    window_result['error'] = f"Qt invocation failed: {str(e)}"
                 
                 # Process results
-                if microphone_result['success'] or microphone_result['window_opened']:
+                if window_result['success'] or window_result['window_opened']:
                     results['status'] = 'Completed'
                     results['progress'] = 100
-                    results['microphone_opened'] = True
-                    results['instructions'].append("✅ Microphone test window opened successfully")
-                    results['instructions'].append("💡 Test microphone functionality in the opened window")
-                elif microphone_result['error']:
+                    results[f'{label.lower()}_opened'] = True
+                    results['instructions'].append(f"✅ {label} test window opened successfully")
+                    results['instructions'].append(f"💡 Test {label.lower()} functionality in the opened window")
+                elif window_result['error']:
                     results['status'] = 'Error'
-                    results['errors'].append(f"Microphone test error: {microphone_result['error']}")
+                    results['errors'].append(f"{label} test error: {window_result['error']}")
                 else:
                     results['status'] = 'Error'
-                    results['errors'].append("Unknown error in microphone test")
+                    results['errors'].append(f"Unknown error in {label.lower()} test")
                 
                 results['end_time'] = datetime.now()
                 
@@ -971,7 +1108,7 @@ class SystemTests:
                 
             except Exception as e:
                 results['status'] = 'Error'
-                results['errors'].append(f"Microphone test error: {str(e)}")
+                results['errors'].append(f"{label} test error: {str(e)}")
                 results['end_time'] = datetime.now()
                 
                 if callback:
@@ -980,7 +1117,7 @@ class SystemTests:
             finally:
                 self.is_testing = False
         
-        thread = threading.Thread(target=microphone_test_worker)
+        thread = threading.Thread(target=window_test_worker)
         thread.daemon = True
         thread.start()
         
@@ -995,33 +1132,24 @@ class SystemTests:
         recommendations = []
         
         try:
-            # CPU recommendations
             cpu_cores = hardware_info.get('cpu', {}).get('cores_physical', 1)
-            if cpu_cores >= 4:
-                recommendations.append("Run CPU stress test for 60 seconds to test multi-core performance")
-            else:
-                recommendations.append("Run CPU stress test for 30 seconds (fewer cores detected)")
+            recommendations.append(self._pick_recommendation(cpu_cores, CPU_RECOMMENDATIONS))
             
-            # Memory recommendations
             total_memory = hardware_info.get('memory', {}).get('total', 0)
-            if total_memory >= 8:
-                recommendations.append("Run memory test with 500MB to test RAM stability")
-            else:
-                recommendations.append("Run memory test with 100MB (limited RAM detected)")
-            
-            # Disk recommendations
-            recommendations.append("Run disk speed test to check storage performance")
+            recommendations.append(self._pick_recommendation(total_memory, MEMORY_RECOMMENDATIONS))
             
-            # Network recommendations
-            recommendations.append("Run network speed test to check internet connectivity")
-            
-            # Stability test
-            recommendations.append("Run system stability test for 5 minutes to check overall system health")
+            # Disk, network and stability tests apply to every machine
+            recommendations.extend(GENERAL_RECOMMENDATIONS)
             
         except Exception as e:
             recommendations.append(f"Error generating recommendations: {str(e)}")
         
         return recommendations
+    
+    @staticmethod
+    def _pick_recommendation(value, table):
+        """First recommendation in table whose threshold value reaches"""
+        return next(text for threshold, text in table if value >= threshold)
 
 # Test the module
 if __name__ == "__main__":
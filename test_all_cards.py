@@ -6,11 +6,15 @@ Test script to verify all card details are included in CSV generation
 
 import sys
 import os
-import glob
-import time
 from script import LaptopTestingApp
 from PySide6.QtWidgets import QApplication
 
+def _list_reports():
+    """Names of the system_report_*.csv files in the working directory"""
+    with os.scandir('.') as entries:
+        return {e.name for e in entries
+                if e.name.startswith('system_report_') and e.name.endswith('.csv')}
+
 def test_all_cards_csv():
     """Test that all cards from System Overview are included in CSV"""
     print("Testing CSV generation with all card details...")
@@ -25,25 +29,20 @@ def test_all_cards_csv():
         main_app = LaptopTestingApp()
         
         # Get existing CSV files before generation
-        existing_files = set(glob.glob("system_report_*.csv"))
-        
-        # Call generate_csv_report (no parameters)
-        result = main_app.generate_csv_report()
+        existing_files = _list_reports()
         
-        # Wait a moment for file to be written
-        time.sleep(1)
+        # Call generate_csv_report (no parameters); the report is written on
+        # a worker thread, so wait for that to finish rather than guessing
+        main_app.generate_csv_report()
+        main_app.report_worker.wait(60000)
         
-        # Find the new CSV file
-        new_files = set(glob.glob("system_report_*.csv")) - existing_files
+        # Find the new CSV file, newest first if several appeared
+        new_files = _list_reports() - existing_files
         
-        if new_files and result:
-            csv_file = list(new_files)[0]
+        if new_files:
+            csv_file = max(new_files, key=os.path.getmtime)
             print(f"✓ CSV generation successful: {csv_file}")
             
-            # Read and analyze the generated CSV
-            with open(csv_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
             # Check for all expected card sections
             expected_cards = [
                 "=== SYSTEM SUMMARY CARD ===",
@@ -56,9 +55,63 @@ def test_all_cards_csv():
                 "=== OTHER INFORMATION CARD ==="
             ]
             
+            # Key details in each card, by the card label used when reporting
+            expected_details = [
+                ("CPU", [
+                    "CPU Information,Name,",
+                    "CPU Information,Architecture,",
+                    "CPU Information,Physical Cores,",
+                    "CPU Information,Logical Cores,",
+                    "CPU Information,Vendor,"
+                ]),
+                ("RAM", [
+                    "RAM Information,Total,",
+                    "RAM Information,Available,",
+                    "RAM Information,Used,",
+                    "RAM Information,Percentage,",
+                    "RAM Information,Memory Slots,"
+                ]),
+                ("ROM", [
+                    "ROM Information,Partitions,",
+                    "ROM Information,Drive C",
+                    "ROM Information,Drive D"
+                ]),
+                ("Battery", [
+                    "Battery Information,Present,",
+                    "Battery Information,Charge Percent,",
+                    "Battery Information,Status,",
+                    "Battery Information,Time Left,"
+                ]),
+                ("Other", [
+                    "Other Information,Sensors (Temp),",
+                    "Other Information,Fan Speeds,",
+                    "Other Information,Camera(s),",
+                    "Other Information,TPM,",
+                    "Other Information,Chassis Type,",
+                    "Other Information,Secure Boot,"
+                ])
+            ]
+            
+            # Every expected string starts a row, so bucket them by their first
+            # field and only test the bucket selected by each line's first field
+            by_section = {}
+            for card in expected_cards:
+                by_section.setdefault(card, []).append(card)
+            for _, details in expected_details:
+                for detail in details:
+                    by_section.setdefault(detail.split(',', 1)[0], []).append(detail)
+            found = set()
+            
+            # Stream the generated CSV once, collecting the expected rows it contains
+            with open(csv_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    for expected in by_section.get(line.split(',', 1)[0], ()):
+                        if line.startswith(expected):
+                            found.add(expected)
+            
             print("\nChecking for all card sections:")
             for card in expected_cards:
-                if card in content:
+                if card in found:
                     print(f"✓ Found: {card}")
                 else:
                     print(f"✗ Missing: {card}")
@@ -66,78 +119,12 @@ def test_all_cards_csv():
             # Check for key details in each card
             print("\nChecking key details in cards:")
             
-            # CPU Card details
-            cpu_details = [
-                "CPU Information,Name,",
-                "CPU Information,Architecture,",
-                "CPU Information,Physical Cores,",
-                "CPU Information,Logical Cores,",
-                "CPU Information,Vendor,"
-            ]
-            
-            for detail in cpu_details:
-                if detail in content:
-                    print(f"✓ Found CPU detail: {detail.split(',')[1]}")
-                else:
-                    print(f"✗ Missing CPU detail: {detail.split(',')[1]}")
-            
-            # RAM Card details
-            ram_details = [
-                "RAM Information,Total,",
-                "RAM Information,Available,",
-                "RAM Information,Used,",
-                "RAM Information,Percentage,",
-                "RAM Information,Memory Slots,"
-            ]
-            
-            for detail in ram_details:
-                if detail in content:
-                    print(f"✓ Found RAM detail: {detail.split(',')[1]}")
-                else:
-                    print(f"✗ Missing RAM detail: {detail.split(',')[1]}")
-            
-            # ROM Card details
-            rom_details = [
-                "ROM Information,Partitions,",
-                "ROM Information,Drive C",
-                "ROM Information,Drive D"
-            ]
-            
-            for detail in rom_details:
-                if detail in content:
-                    print(f"✓ Found ROM detail: {detail.split(',')[1]}")
-                else:
-                    print(f"✗ Missing ROM detail: {detail.split(',')[1]}")
-            
-            # Battery Card details
-            battery_details = [
-                "Battery Information,Present,",
-                "Battery Information,Charge Percent,",
-                "Battery Information,Status,",
-                "Battery Information,Time Left,"
-            ]
-            
-            for detail in battery_details:
-                if detail in content:
-                    print(f"✓ Found Battery detail: {detail.split(',')[1]}")
-                else:
-                    print(f"✗ Missing Battery detail: {detail.split(',')[1]}")
-            
-            # Other Information Card details
-            other_details = [
-                "Other Information,Sensors (Temp),",
-                "Other Information,Fan Speeds,",
-                "Other Information,Camera(s),",
-                "Other Information,TPM,",
-                "Other Information,Chassis Type,",
-                "Other Information,Secure Boot,"
-            ]
-            
-            for detail in other_details:
-                if detail in content:
-                    print(f"✓ Found Other detail: {detail.split(',')[1]}")
-                else:
-                    print(f"✗ Missing Other detail: {detail.split(',')[1]}")
+            for label, details in expected_details:
+                for detail in details:
+                    if detail in found:
+                        print(f"✓ Found {label} detail: {detail.split(',')[1]}")
+                    else:
+                        print(f"✗ Missing {label} detail: {detail.split(',')[1]}")
             
             print(f"\n📄 Generated CSV file: {csv_file}")
             print("✅ All card details verification completed!")
@@ -6,11 +6,15 @@ Test script to verify all installed software is included in CSV generation
 
 import sys
 import os
-import glob
-import time
 from script import LaptopTestingApp
 from PySide6.QtWidgets import QApplication
 
+def _list_reports():
+    """Names of the system_report_*.csv files in the working directory"""
+    with os.scandir('.') as entries:
+        return {e.name for e in entries
+                if e.name.startswith('system_report_') and e.name.endswith('.csv')}
+
 def test_all_software_csv():
     """Test that all installed software is included in CSV"""
     print("Testing CSV generation with all installed software...")
@@ -25,64 +29,47 @@ def test_all_software_csv():
         main_app = LaptopTestingApp()
         
         # Get existing CSV files before generation
-        existing_files = set(glob.glob("system_report_*.csv"))
-        
-        # Call generate_csv_report (no parameters)
-        result = main_app.generate_csv_report()
+        existing_files = _list_reports()
         
-        # Wait a moment for file to be written
-        time.sleep(1)
+        # Call generate_csv_report (no parameters); the report is written on
+        # a worker thread, so wait for that to finish rather than guessing
+        main_app.generate_csv_report()
+        main_app.report_worker.wait(60000)
         
-        # Find the new CSV file
-        new_files = set(glob.glob("system_report_*.csv")) - existing_files
+        # Find the new CSV file, newest first if several appeared
+        new_files = _list_reports() - existing_files
         
         if new_files:
-            csv_file = list(new_files)[0]
+            csv_file = max(new_files, key=os.path.getmtime)
             print(f"✓ CSV generation successful: {csv_file}")
             
-            # Read and analyze the generated CSV
+            # Stream the generated CSV, picking out the software section
+            software_header = None
+            software_lines = []
+            in_software_section = False
+            
             with open(csv_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+                for line in f:
+                    if "INSTALLED SOFTWARE" in line:
+                        software_header = line
+                        in_software_section = True
+                    elif in_software_section and line.strip() == ",,":
+                        break  # End of software section
+                    elif in_software_section and line.startswith("Software ") and "," in line:
+                        software_lines.append(line.strip())
             
             # Check for the updated header
-            if "INSTALLED SOFTWARE (All)" in content:
+            if software_header and "INSTALLED SOFTWARE (All)" in software_header:
                 print("✓ Found: INSTALLED SOFTWARE (All) - header updated correctly")
-            elif "INSTALLED SOFTWARE (Top 10)" in content:
+            elif software_header and "INSTALLED SOFTWARE (Top 10)" in software_header:
                 print("✗ Still shows: INSTALLED SOFTWARE (Top 10) - change not applied")
             else:
                 print("✗ Software section header not found")
             
             # Count software entries
-            lines = content.split('\n')
-            software_count = 0
-            in_software_section = False
-            
-            for line in lines:
-                if "INSTALLED SOFTWARE" in line:
-                    in_software_section = True
-                    continue
-                elif in_software_section and line.strip() == ",,":
-                    break  # End of software section
-                elif in_software_section and line.startswith("Software ") and "," in line:
-                    software_count += 1
-            
+            software_count = len(software_lines)
             print(f"📊 Total software entries found: {software_count}")
             
-            # Show first few and last few software entries
-            software_lines = []
-            in_software_section = False
-            
-            for line in lines:
-                if "INSTALLED SOFTWARE" in line:
-                    in_software_section = True
-                    continue
-                elif line.strip() == "Software,Name,Version":
-                    continue  # Skip header
-                elif in_software_section and line.strip() == ",,":
-                    break  # End of software section
-                elif in_software_section and line.startswith("Software ") and "," in line:
-                    software_lines.append(line.strip())
-            
             if software_lines:
                 print("\n📋 Sample software entries:")
                 # Show first 5
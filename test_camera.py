@@ -5,7 +5,8 @@ This script demonstrates the camera testing functionality
 """
 
 from system_tests import SystemTests
-import time
+import queue
+import threading
 
 def main():
     print("📷 Camera Test Demo")
@@ -14,8 +15,8 @@ def main():
     # Create system tests instance
     tests = SystemTests()
     
-    # Callback function to show progress
-    def progress_callback(results):
+    # Show progress from the test's snapshots
+    def print_progress(results):
         status = results.get('status', 'Unknown')
         progress = results.get('progress', 0)
         
@@ -31,6 +32,23 @@ def main():
             for error in results['errors']:
                 print(f"  ⚠ Error: {error}")
     
+    # Print on a separate thread so the test worker never waits on stdout
+    progress_queue = queue.Queue()
+    
+    def printer():
+        while True:
+            results = progress_queue.get()
+            if results is None:
+                break
+            print_progress(results)
+    
+    printer_thread = threading.Thread(target=printer, daemon=True)
+    printer_thread.start()
+    
+    # Callback function to show progress
+    def progress_callback(results):
+        progress_queue.put_nowait(results)
+    
     print("Starting camera test...")
     print("This test will attempt to open your camera!")
     print()
@@ -39,8 +57,11 @@ def main():
     test_results = tests.camera_test(callback=progress_callback)
     
     # Wait for test completion
-    while tests.is_testing:
-        time.sleep(1)
+    tests.wait_until_stopped(timeout=300)
+    
+    # Let the printer finish what the test reported
+    progress_queue.put(None)
+    printer_thread.join()
     
     print()
     print("📷 Camera Test Complete!")
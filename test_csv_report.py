@@ -91,10 +91,9 @@ def test_csv_generation():
         csv_data.append(['CSV Generation', 'PASSED', f"Generated {len(csv_data)} rows of data"])
         
         # Write CSV file
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
             writer = csv.writer(csvfile)
-            for row in csv_data:
-                writer.writerow(row)
+            writer.writerows(csv_data)
         
         print(f"✅ CSV report generated successfully!")
         print(f"📄 File: {filename}")
@@ -136,10 +136,9 @@ def test_enhanced_csv_with_cards():
         csv_data.append(['Memory Display', 'ENHANCED', 'Available/Total format'])
         
         # Write CSV file
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
             writer = csv.writer(csvfile)
-            for row in csv_data:
-                writer.writerow(row)
+            writer.writerows(csv_data)
         
         print(f"✅ Enhanced CSV report generated successfully!")
         print(f"📄 File: {filename}")
@@ -132,10 +132,9 @@ def simulate_generate_report_button():
         csv_data.append(['WMI Timeout Protection', 'ACTIVE', 'Prevents hanging on problematic WMI queries'])
         
         # Write CSV file
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
             writer = csv.writer(csvfile)
-            for row in csv_data:
-                writer.writerow(row)
+            writer.writerows(csv_data)
         
         print(f"✅ CSV report generated successfully!")
         print(f"📄 File: {filename}")